@@ -1,5 +1,6 @@
 """Authentication types and utilities for the Lightcone SDK."""
 
+import time
 from dataclasses import dataclass, field
 from typing import Optional, Literal, ClassVar
 
@@ -61,7 +62,6 @@ class AuthCredentials:
 
     def is_authenticated(self) -> bool:
         """Whether the session is still valid (not expired)."""
-        import time
         return time.time() < self.expires_at
 
 
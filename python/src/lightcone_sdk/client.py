@@ -5,6 +5,7 @@ Mirrors rust/src/client.rs — unified entry point with sub-client accessors.
 
 from __future__ import annotations
 
+import base64
 from typing import Optional
 
 from solders.pubkey import Pubkey
@@ -174,10 +175,9 @@ class LightconeClient:
 
         elif strategy.kind == SigningStrategyKind.WALLET_ADAPTER:
             signer: ExternalSigner = strategy.signer  # type: ignore[assignment]
-            import base64 as _b64
             tx_bytes = bytes(tx)  # type: ignore[arg-type]
             signed_bytes = await signer.sign_transaction(tx_bytes)
-            base64_tx = _b64.b64encode(signed_bytes).decode("ascii")
+            base64_tx = base64.b64encode(signed_bytes).decode("ascii")
             # Submit via RPC
             if self._rpc_url is not None:
                 import aiohttp
@@ -195,9 +195,8 @@ class LightconeClient:
             raise SdkError("rpc_url is required for WalletAdapter signing")
 
         elif strategy.kind == SigningStrategyKind.PRIVY:
-            import base64 as _b64
             tx_bytes = bytes(tx)  # type: ignore[arg-type]
-            base64_tx = _b64.b64encode(tx_bytes).decode("ascii")
+            base64_tx = base64.b64encode(tx_bytes).decode("ascii")
             result = await self.privy().sign_and_send_tx(
                 strategy.wallet_id, base64_tx,  # type: ignore[arg-type]
             )
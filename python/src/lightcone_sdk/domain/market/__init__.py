@@ -49,10 +49,10 @@ class Status(str, Enum):
 
     @staticmethod
     def from_str(s: str) -> "Status":
-        try:
-            return Status(s.lower())
-        except ValueError:
-            return Status.PENDING
+        return _STATUSES.get(s.lower(), Status.PENDING)
+
+
+_STATUSES: dict[str, Status] = {status.value: status for status in Status}
 
 
 class MarketResolutionKind(str, Enum):
@@ -5,7 +5,7 @@ from decimal import Decimal, InvalidOperation
 from enum import Enum
 from typing import Optional
 
-from ...shared.types import TimeInForce, TriggerType
+from ...shared.types import Side, TimeInForce, TriggerType
 
 
 class OrderType(str, Enum):
@@ -257,8 +257,6 @@ class UserSnapshotOrder:
 
     @staticmethod
     def from_dict(d: dict) -> "UserSnapshotOrder":
-        from ...shared.types import Side as _Side
-
         trigger_type_raw = d.get("trigger_type")
         time_in_force_raw = d.get("time_in_force")
         remaining = str(d.get("remaining", "0"))
@@ -269,7 +267,7 @@ class UserSnapshotOrder:
         order_type = str(d.get("order_type", OrderType.LIMIT.value)).lower()
         return UserSnapshotOrder(
             order_hash=d.get("order_hash", ""),
-            side=int(_Side.from_wire(d.get("side", 0))),
+            side=int(Side.from_wire(d.get("side", 0))),
             price=d.get("price", "0"),
             size=str(size),
             orderbook_id=d.get("orderbook_id", ""),
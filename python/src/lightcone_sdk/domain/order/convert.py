@@ -12,16 +12,18 @@ from . import (
 )
 from .wire import WsOrder
 from .state import UserOpenLimitOrders, UserTriggerOrders
+from ...shared.price import is_zero
 from ...shared.types import TimeInForce, TriggerType
 
+# Wire status string -> OrderStatus; unknown values fall back without the
+# cost of raising and catching ValueError per order update.
+_ORDER_STATUSES: dict[str, OrderStatus] = {status.value: status for status in OrderStatus}
+
 
 def order_from_ws(ws: WsOrder, market_pubkey: str, orderbook_id: str) -> LimitOrder:
     status = OrderStatus.OPEN
     if ws.status:
-        try:
-            status = OrderStatus(ws.status.upper())
-        except ValueError:
-            pass
+        status = _ORDER_STATUSES.get(ws.status.upper(), OrderStatus.OPEN)
 
     return LimitOrder(
         order_hash=ws.order_hash,
@@ -57,10 +59,7 @@ def submit_response_from_dict(d: dict) -> SubmitOrderResponse:
 
 def limit_snapshot_to_order(snapshot: UserSnapshotOrder) -> LimitOrder:
     """Convert a limit-type UserSnapshotOrder to a LimitOrder domain type."""
-    try:
-        status = OrderStatus(snapshot.status.upper())
-    except ValueError:
-        status = OrderStatus.OPEN
+    status = _ORDER_STATUSES.get(snapshot.status.upper(), OrderStatus.OPEN)
 
     return LimitOrder(
         market_pubkey=snapshot.market_pubkey,
@@ -109,7 +108,7 @@ def split_snapshot_orders(
             trigger_orders.insert(trigger_snapshot_to_order(snapshot))
         else:
             order = limit_snapshot_to_order(snapshot)
-            if order.remaining_size not in ("0", "", None):
+            if order.remaining_size and not is_zero(order.remaining_size):
                 open_orders.upsert(order)
 
     return open_orders, trigger_orders
@@ -1,36 +1,94 @@
 """Order state containers for WebSocket updates."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional, TypeVar
 from . import LimitOrder, OrderStatus, TriggerOrder
 
+T = TypeVar("T")
+
+
+def _index_orders(
+    orders: dict[str, dict[str, list[T]]], id_attr: str
+) -> dict[str, tuple[str, str]]:
+    """Map each order's id to the (market_pubkey, orderbook_id) bucket holding it."""
+    return {
+        getattr(order, id_attr): (market, orderbook)
+        for market, market_orders in orders.items()
+        for orderbook, order_list in market_orders.items()
+        for order in order_list
+    }
+
+
+def _find_order(
+    orders: dict[str, dict[str, list[T]]],
+    hint: Optional[tuple[str, str]],
+    id_attr: str,
+    order_id: str,
+) -> Optional[tuple[list[T], int]]:
+    """Return (order_list, index) for an order, trying the hinted bucket first.
+
+    The hint is only a cache. If ``orders`` was changed directly and the hint
+    is missing or stale, fall back to scanning every bucket.
+    """
+    if hint is not None:
+        order_list = orders.get(hint[0], {}).get(hint[1], [])
+        for index, existing in enumerate(order_list):
+            if getattr(existing, id_attr) == order_id:
+                return order_list, index
+    for market_orders in orders.values():
+        for order_list in market_orders.values():
+            for index, existing in enumerate(order_list):
+                if getattr(existing, id_attr) == order_id:
+                    return order_list, index
+    return None
+
+
+def _is_empty(orders: dict[str, dict[str, list[T]]]) -> bool:
+    return all(
+        len(order_list) == 0
+        for market_orders in orders.values()
+        for order_list in market_orders.values()
+    )
+
 
 @dataclass
 class UserOpenLimitOrders:
-    """Container for a user's open limit orders, grouped by market_pubkey -> orderbook_id."""
+    """Container for a user's open limit orders, grouped by market_pubkey -> orderbook_id.
+
+    An order_hash -> (market_pubkey, orderbook_id) index points removals at
+    the right list, so they don't scan every market. ``orders`` stays the
+    source of truth: the index is checked against it and a scan covers
+    orders that were added or moved by mutating ``orders`` directly.
+    """
     orders: dict[str, dict[str, list[LimitOrder]]] = field(default_factory=dict)
+    _index: dict[str, tuple[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index = _index_orders(self.orders, "order_hash")
 
     def upsert(self, order: LimitOrder) -> None:
         market = order.market_pubkey
         orderbook = order.orderbook_id
-        if market not in self.orders:
-            self.orders[market] = {}
-        if orderbook not in self.orders[market]:
-            self.orders[market][orderbook] = []
-        order_list = self.orders[market][orderbook]
+        market_orders = self.orders.setdefault(market, {})
         # Remove existing order with same hash before appending
-        self.orders[market][orderbook] = [
-            existing for existing in order_list if existing.order_hash != order.order_hash
+        market_orders[orderbook] = [
+            existing
+            for existing in market_orders.get(orderbook, ())
+            if existing.order_hash != order.order_hash
         ]
-        self.orders[market][orderbook].append(order)
+        market_orders[orderbook].append(order)
+        self._index[order.order_hash] = (market, orderbook)
 
     def remove(self, order_hash: str) -> Optional[LimitOrder]:
-        for market_orders in self.orders.values():
-            for orderbook_id, order_list in market_orders.items():
-                for index, existing in enumerate(order_list):
-                    if existing.order_hash == order_hash:
-                        return order_list.pop(index)
-        return None
+        found = _find_order(
+            self.orders, self._index.pop(order_hash, None), "order_hash", order_hash
+        )
+        if found is None:
+            return None
+        order_list, index = found
+        return order_list.pop(index)
 
     def update(self, order: LimitOrder) -> None:
         if order.status in (OrderStatus.CANCELLED, OrderStatus.FILLED):
@@ -48,44 +106,57 @@ class UserOpenLimitOrders:
         return self.orders.get(market_pubkey)
 
     def all(self) -> list[LimitOrder]:
-        result = []
+        """Copy of every order; iterate the container to read without copying."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[LimitOrder]:
         for market_orders in self.orders.values():
             for order_list in market_orders.values():
-                result.extend(order_list)
-        return result
+                yield from order_list
 
     def is_empty(self) -> bool:
-        return all(
-            len(order_list) == 0
-            for market_orders in self.orders.values()
-            for order_list in market_orders.values()
-        )
+        return _is_empty(self.orders)
 
     def clear(self) -> None:
         self.orders.clear()
+        self._index.clear()
 
 
 @dataclass
 class UserTriggerOrders:
-    """Container for a user's trigger orders, grouped by market_pubkey -> orderbook_id."""
+    """Container for a user's trigger orders, grouped by market_pubkey -> orderbook_id.
+
+    A trigger_order_id -> (market_pubkey, orderbook_id) index points lookups
+    and removals at the right list, so they don't scan every market.
+    ``orders`` stays the source of truth: the index is checked against it and
+    a scan covers orders that were added or moved by mutating ``orders``
+    directly.
+    """
     orders: dict[str, dict[str, list[TriggerOrder]]] = field(default_factory=dict)
+    _index: dict[str, tuple[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index = _index_orders(self.orders, "trigger_order_id")
 
     def insert(self, order: TriggerOrder) -> None:
         market = order.market_pubkey
         orderbook = order.orderbook_id
-        if market not in self.orders:
-            self.orders[market] = {}
-        if orderbook not in self.orders[market]:
-            self.orders[market][orderbook] = []
-        self.orders[market][orderbook].append(order)
+        self.orders.setdefault(market, {}).setdefault(orderbook, []).append(order)
+        self._index[order.trigger_order_id] = (market, orderbook)
 
     def remove(self, trigger_id: str) -> Optional[TriggerOrder]:
-        for market_orders in self.orders.values():
-            for orderbook_id, order_list in market_orders.items():
-                for index, existing in enumerate(order_list):
-                    if existing.trigger_order_id == trigger_id:
-                        return order_list.pop(index)
-        return None
+        found = _find_order(
+            self.orders,
+            self._index.pop(trigger_id, None),
+            "trigger_order_id",
+            trigger_id,
+        )
+        if found is None:
+            return None
+        order_list, index = found
+        return order_list.pop(index)
 
     def get(self, market_pubkey: str, orderbook_id: str) -> Optional[list[TriggerOrder]]:
         market_orders = self.orders.get(market_pubkey)
@@ -97,26 +168,25 @@ class UserTriggerOrders:
         return self.orders.get(market_pubkey)
 
     def get_by_id(self, trigger_id: str) -> Optional[TriggerOrder]:
-        for market_orders in self.orders.values():
-            for order_list in market_orders.values():
-                for existing in order_list:
-                    if existing.trigger_order_id == trigger_id:
-                        return existing
-        return None
+        found = _find_order(
+            self.orders, self._index.get(trigger_id), "trigger_order_id", trigger_id
+        )
+        if found is None:
+            return None
+        order_list, index = found
+        return order_list[index]
 
     def all(self) -> list[TriggerOrder]:
-        result = []
+        """Copy of every order; iterate the container to read without copying."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[TriggerOrder]:
         for market_orders in self.orders.values():
             for order_list in market_orders.values():
-                result.extend(order_list)
-        return result
+                yield from order_list
 
     def is_empty(self) -> bool:
-        return all(
-            len(order_list) == 0
-            for market_orders in self.orders.values()
-            for order_list in market_orders.values()
-        )
+        return _is_empty(self.orders)
 
     def __len__(self) -> int:
         return sum(
@@ -127,3 +197,4 @@ class UserTriggerOrders:
 
     def clear(self) -> None:
         self.orders.clear()
+        self._index.clear()
@@ -26,7 +26,7 @@ class UserOrderUpdateBalance:
     @staticmethod
     def from_dict(d: dict) -> "UserOrderUpdateBalance":
         return UserOrderUpdateBalance(
-            outcomes=[ConditionalBalance.from_dict(o) for o in d.get("outcomes", [])],
+            outcomes=[ConditionalBalance.from_dict(o) for o in d.get("outcomes", ())],
         )
 
 
@@ -268,27 +268,29 @@ class UserSnapshot:
 
     @staticmethod
     def from_dict(d: dict) -> "UserSnapshot":
-        balances_raw = d.get("balances", [])
+        balances_raw = d.get("balances", ())
         if isinstance(balances_raw, dict):
-            balances_raw = [
-                {
-                    **(
-                        {"orderbook_id": orderbook_id}
-                        if isinstance(balance, dict) and "orderbook_id" not in balance
-                        else {}
-                    ),
-                    **(balance if isinstance(balance, dict) else {}),
-                }
-                for orderbook_id, balance in balances_raw.items()
-            ]
+            # Keyed by orderbook_id: parse each entry as-is and fill the id
+            # from the key, rather than copying every entry into a merged dict.
+            balances = []
+            for orderbook_id, balance in balances_raw.items():
+                if not isinstance(balance, dict):
+                    balances.append(UserSnapshotBalance())
+                    continue
+                entry = UserSnapshotBalance.from_dict(balance)
+                if "orderbook_id" not in balance:
+                    entry.orderbook_id = orderbook_id
+                balances.append(entry)
+        else:
+            balances = [UserSnapshotBalance.from_dict(b) for b in balances_raw]
         return UserSnapshot(
-            orders=[UserSnapshotOrder.from_dict(o) for o in d.get("orders", [])],
-            balances=[UserSnapshotBalance.from_dict(b) for b in balances_raw],
+            orders=[UserSnapshotOrder.from_dict(o) for o in d.get("orders", ())],
+            balances=balances,
             global_deposits=[
-                GlobalDepositBalance.from_dict(g) for g in d.get("global_deposits", [])
+                GlobalDepositBalance.from_dict(g) for g in d.get("global_deposits", ())
             ],
             notifications=[
-                Notification.from_dict(n) for n in d.get("notifications", [])
+                Notification.from_dict(n) for n in d.get("notifications", ())
             ],
             nonce=d.get("nonce", 0),
         )
@@ -416,13 +418,11 @@ class UserOrderFill:
 
     @staticmethod
     def from_dict(d: dict) -> "UserOrderFill":
-        from ...shared.types import Side as _Side
-
         return UserOrderFill(
             order_hash=d.get("order_hash", ""),
             market_pubkey=d.get("market_pubkey", ""),
             orderbook_id=d.get("orderbook_id", ""),
-            side=int(_Side.from_wire(d.get("side", 0))),
+            side=int(Side.from_wire(d.get("side", 0))),
             role=d.get("role", ""),
             price=str(d.get("price", "0")),
             size=str(d.get("size", "0")),
@@ -433,7 +433,7 @@ class UserOrderFill:
             outcome_index=d.get("outcome_index", 0),
             status=d.get("status", ""),
             created_at=str(d.get("created_at", "")),
-            fills=[OrderFillEvent.from_dict(f) for f in d.get("fills", [])],
+            fills=[OrderFillEvent.from_dict(f) for f in d.get("fills", ())],
         )
 
 
@@ -448,7 +448,7 @@ class UserOrderFillsResponse:
     @staticmethod
     def from_dict(d: dict) -> "UserOrderFillsResponse":
         return UserOrderFillsResponse(
-            orders=[UserOrderFill.from_dict(o) for o in d.get("orders", [])],
+            orders=[UserOrderFill.from_dict(o) for o in d.get("orders", ())],
             next_cursor=d.get("next_cursor"),
             has_more=d.get("has_more", False),
         )
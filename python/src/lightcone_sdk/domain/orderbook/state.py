@@ -1,8 +1,145 @@
 """Orderbook state for WebSocket updates."""
 
+import math
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Any, Iterable, Optional, Union, cast
+
+from ...shared.price import is_zero
+
+
+def _dict_level(level) -> tuple[str, str]:
+    """``(price, size)`` from a raw dict level."""
+    price = str(level.get("price", level[0] if isinstance(level, list) else "0"))
+    size = str(
+        level.get(
+            "size", level[1] if isinstance(level, list) and len(level) > 1 else "0"
+        )
+    )
+    return price, size
+
+
+def _finite_float(value: str) -> Optional[float]:
+    """``float(value)``, or ``None`` if it is malformed or not finite."""
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if math.isfinite(parsed) else None
+
+
+class _BookSide(dict[str, str]):
+    """One side of the book: a ``price -> size`` dict with a parsed index.
+
+    Every write, including item assignment by callers, keeps the index in
+    step, so price and size strings are parsed once per level change rather
+    than on every query. ``ranked`` holds ``(float(price), price)`` sorted
+    ascending, so best-of-book is an end lookup and top-N is a slice. A level
+    whose price or size does not parse stays in the dict but is left out of
+    ``ranked`` or ``sz``.
+    """
+
+    __slots__ = ("px", "sz", "ranked")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.px: dict[str, float] = {}
+        self.sz: dict[str, float] = {}
+        self.ranked: list[tuple[float, str]] = []
+        self._reindex()
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copies and unpickled books re-derive
+        # the index from the levels.
+        return (self.__class__, (dict(self),))
+
+    def _reindex(self) -> None:
+        self.px.clear()
+        self.sz.clear()
+        for price, size in self.items():
+            px = _finite_float(price)
+            if px is not None:
+                self.px[price] = px
+            self._set_size(price, size)
+        self.ranked = sorted((px, price) for price, px in self.px.items())
+
+    def _set_size(self, price: str, size: str) -> None:
+        sz = _finite_float(size)
+        if sz is None:
+            self.sz.pop(price, None)
+        else:
+            self.sz[price] = sz
+
+    def _untrack(self, price: str) -> None:
+        px = self.px.pop(price, None)
+        if px is not None:
+            del self.ranked[bisect_left(self.ranked, (px, price))]
+        self.sz.pop(price, None)
+
+    def __setitem__(self, price: str, size: str) -> None:
+        if price not in self:
+            px = _finite_float(price)
+            if px is not None:
+                self.px[price] = px
+                insort(self.ranked, (px, price))
+        super().__setitem__(price, size)
+        self._set_size(price, size)
+
+    def __delitem__(self, price: str) -> None:
+        super().__delitem__(price)
+        self._untrack(price)
+
+    def pop(self, price, *default):
+        if price in self:
+            size = super().pop(price)
+            self._untrack(price)
+            return size
+        return super().pop(price, *default)
+
+    def popitem(self) -> tuple[str, str]:
+        price, size = super().popitem()
+        self._untrack(price)
+        return price, size
+
+    def setdefault(self, price, size=None):
+        if price not in self:
+            self[price] = size
+        return self[price]
+
+    def update(self, *args, **kwargs) -> None:
+        for price, size in dict(*args, **kwargs).items():
+            self[price] = size
+
+    def __ior__(self, other: Any) -> "_BookSide":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.px.clear()
+        self.sz.clear()
+        self.ranked.clear()
+
+    def apply_level(self, price: str, size: str) -> None:
+        """Apply one delta level: a zero size removes the price."""
+        if is_zero(size):
+            self.pop(price, None)
+        else:
+            self[price] = size
+
+    def load(self, updates: Iterable[tuple[str, str]]) -> None:
+        """Replace every level with snapshot ``(price, size)`` pairs.
+
+        Re-indexes once at the end instead of inserting each level in order.
+        """
+        super().clear()
+        for price, size in updates:
+            if is_zero(size):
+                super().pop(price, None)
+            else:
+                super().__setitem__(price, size)
+        self._reindex()
 
 
 @dataclass(frozen=True)
@@ -63,7 +200,13 @@ class OrderbookApplyResult:
 
 @dataclass
 class OrderbookState:
-    """Local orderbook state maintained from WebSocket updates."""
+    """Local orderbook state maintained from WebSocket updates.
+
+    ``bids`` and ``asks`` are ``price -> size`` dicts owned by the state:
+    dicts passed in or assigned later are copied into a dict subclass that
+    keeps the parsed price index behind best-of-book and top-N queries in
+    step with every write.
+    """
 
     orderbook_id: str
     bids: dict[str, str] = field(default_factory=dict)
@@ -71,6 +214,27 @@ class OrderbookState:
     sequence: int = 0
     _has_snapshot: bool = field(default=False, init=False, repr=False)
     _awaiting_snapshot: bool = field(default=False, init=False, repr=False)
+    # mid_price/spread results, cached against the (best_bid, best_ask) they
+    # were computed from.
+    _mid_cache: tuple[Optional[str], Optional[str], Optional[str]] = field(
+        default=(None, None, None), init=False, repr=False, compare=False
+    )
+    _spread_cache: tuple[Optional[str], Optional[str], Optional[str]] = field(
+        default=(None, None, None), init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("bids", "asks") and not isinstance(value, _BookSide):
+            value = _BookSide(value)
+        super().__setattr__(name, value)
+
+    @property
+    def _bid_side(self) -> _BookSide:
+        return cast(_BookSide, self.bids)
+
+    @property
+    def _ask_side(self) -> _BookSide:
+        return cast(_BookSide, self.asks)
 
     def apply(self, update) -> OrderbookApplyResult:
         """Apply a book update (snapshot or delta).
@@ -97,8 +261,6 @@ class OrderbookState:
             )
 
         if update.is_snapshot:
-            self.bids.clear()
-            self.asks.clear()
             self._has_snapshot = True
             self._awaiting_snapshot = False
         else:
@@ -128,17 +290,14 @@ class OrderbookState:
                     OrderbookRefreshReason.sequence_gap(expected, update.seq)
                 )
 
-        for bid in update.bids:
-            if bid.size == "0":
-                self.bids.pop(bid.price, None)
-            else:
-                self.bids[bid.price] = bid.size
-
-        for ask in update.asks:
-            if ask.size == "0":
-                self.asks.pop(ask.price, None)
-            else:
-                self.asks[ask.price] = ask.size
+        if update.is_snapshot:
+            self._bid_side.load((bid.price, bid.size) for bid in update.bids)
+            self._ask_side.load((ask.price, ask.size) for ask in update.asks)
+        else:
+            for bid in update.bids:
+                self._bid_side.apply_level(bid.price, bid.size)
+            for ask in update.asks:
+                self._ask_side.apply_level(ask.price, ask.size)
 
         self.sequence = update.seq
         return OrderbookApplyResult.applied()
@@ -161,8 +320,6 @@ class OrderbookState:
 
         is_snapshot = update.get("is_snapshot", False)
         if is_snapshot:
-            self.bids.clear()
-            self.asks.clear()
             self._has_snapshot = True
             self._awaiting_snapshot = False
         else:
@@ -193,29 +350,16 @@ class OrderbookState:
                     OrderbookRefreshReason.sequence_gap(expected, seq)
                 )
 
-        for bid in update.get("bids", []):
-            price = str(bid.get("price", bid[0] if isinstance(bid, list) else "0"))
-            size = str(
-                bid.get(
-                    "size", bid[1] if isinstance(bid, list) and len(bid) > 1 else "0"
-                )
-            )
-            if size == "0":
-                self.bids.pop(price, None)
-            else:
-                self.bids[price] = size
-
-        for ask in update.get("asks", []):
-            price = str(ask.get("price", ask[0] if isinstance(ask, list) else "0"))
-            size = str(
-                ask.get(
-                    "size", ask[1] if isinstance(ask, list) and len(ask) > 1 else "0"
-                )
-            )
-            if size == "0":
-                self.asks.pop(price, None)
-            else:
-                self.asks[price] = size
+        bids = [_dict_level(bid) for bid in update.get("bids", [])]
+        asks = [_dict_level(ask) for ask in update.get("asks", [])]
+        if is_snapshot:
+            self._bid_side.load(bids)
+            self._ask_side.load(asks)
+        else:
+            for price, size in bids:
+                self._bid_side.apply_level(price, size)
+            for price, size in asks:
+                self._ask_side.apply_level(price, size)
 
         seq = update.get("seq")
         if seq is not None:
@@ -223,28 +367,62 @@ class OrderbookState:
         return OrderbookApplyResult.applied()
 
     def best_bid(self) -> Optional[str]:
-        if not self.bids:
+        ranked = self._bid_side.ranked
+        if not ranked:
             return None
-        return max(self.bids.keys(), key=lambda p: float(p))
+        return ranked[-1][1]
 
     def best_ask(self) -> Optional[str]:
-        if not self.asks:
+        ranked = self._ask_side.ranked
+        if not ranked:
             return None
-        return min(self.asks.keys(), key=lambda p: float(p))
+        return ranked[0][1]
+
+    def top_bids(self, n: int) -> list[tuple[str, str]]:
+        """Up to ``n`` ``(price, size)`` bid levels, best (highest) first."""
+        if n <= 0:
+            return []
+        bids = self._bid_side
+        return [(price, bids[price]) for _, price in reversed(bids.ranked[-n:])]
+
+    def top_asks(self, n: int) -> list[tuple[str, str]]:
+        """Up to ``n`` ``(price, size)`` ask levels, best (lowest) first."""
+        if n <= 0:
+            return []
+        asks = self._ask_side
+        return [(price, asks[price]) for _, price in asks.ranked[:n]]
+
+    def total_bid_depth(self) -> float:
+        """Sum of all bid sizes."""
+        return math.fsum(self._bid_side.sz.values())
+
+    def total_ask_depth(self) -> float:
+        """Sum of all ask sizes."""
+        return math.fsum(self._ask_side.sz.values())
 
     def mid_price(self) -> Optional[str]:
         bb = self.best_bid()
         ba = self.best_ask()
-        if bb is None or ba is None:
-            return None
-        return str((Decimal(bb) + Decimal(ba)) / 2)
+        cached_bb, cached_ba, cached = self._mid_cache
+        if bb == cached_bb and ba == cached_ba:
+            return cached
+        result = None
+        if bb is not None and ba is not None:
+            result = str((Decimal(bb) + Decimal(ba)) / 2)
+        self._mid_cache = (bb, ba, result)
+        return result
 
     def spread(self) -> Optional[str]:
         bb = self.best_bid()
         ba = self.best_ask()
-        if bb is None or ba is None:
-            return None
-        return str(Decimal(ba) - Decimal(bb))
+        cached_bb, cached_ba, cached = self._spread_cache
+        if bb == cached_bb and ba == cached_ba:
+            return cached
+        result = None
+        if bb is not None and ba is not None:
+            result = str(Decimal(ba) - Decimal(bb))
+        self._spread_cache = (bb, ba, result)
+        return result
 
     def is_empty(self) -> bool:
         return not self.bids and not self.asks
@@ -1,12 +1,13 @@
 """Orderbook wire types."""
 
 from dataclasses import dataclass, field
+from sys import intern
 from typing import Optional
 
-from ...error import _require
+from ...error import DeserializationError, _require
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceLevel:
     price: str
     size: str
@@ -21,6 +22,13 @@ class PriceLevel:
         return PriceLevel(price=str(lst[0]) if lst else "0", size=str(lst[1]) if len(lst) > 1 else "0")
 
 
+def _price_levels(levels) -> list[PriceLevel]:
+    """Decode REST depth levels, given as objects or ``[price, size]`` pairs."""
+    from_dict = PriceLevel.from_dict
+    from_list = PriceLevel.from_list
+    return [from_dict(level) if isinstance(level, dict) else from_list(level) for level in levels]
+
+
 @dataclass
 class OrderbookDepthResponse:
     bids: list[PriceLevel] = field(default_factory=list)
@@ -35,8 +43,8 @@ class OrderbookDepthResponse:
     @staticmethod
     def from_dict(d: dict) -> "OrderbookDepthResponse":
         return OrderbookDepthResponse(
-            bids=[PriceLevel.from_dict(b) if isinstance(b, dict) else PriceLevel.from_list(b) for b in d.get("bids", [])],
-            asks=[PriceLevel.from_dict(a) if isinstance(a, dict) else PriceLevel.from_list(a) for a in d.get("asks", [])],
+            bids=_price_levels(d.get("bids", ())),
+            asks=_price_levels(d.get("asks", ())),
             orderbook_id=d.get("orderbook_id"),
             market_pubkey=d.get("market_pubkey"),
             best_bid=d.get("best_bid"),
@@ -98,7 +106,7 @@ class OrderbooksResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WsBookLevel:
     """WebSocket book level with side."""
     side: int
@@ -114,7 +122,19 @@ class WsBookLevel:
         )
 
 
-@dataclass
+def _ws_book_levels(levels: list) -> list[WsBookLevel]:
+    """Decode a list of WebSocket book levels in one pass.
+
+    Inlines ``WsBookLevel.from_dict`` and constructs positionally, since
+    snapshots can carry hundreds of levels.
+    """
+    return [
+        WsBookLevel(level.get("side", 0), str(level.get("price", "0")), str(level.get("size", "0")))
+        for level in levels
+    ]
+
+
+@dataclass(slots=True)
 class WsOrderBook:
     """WebSocket orderbook snapshot/delta."""
     orderbook_id: str
@@ -128,15 +148,15 @@ class WsOrderBook:
     def from_dict(d: dict) -> "WsOrderBook":
         ob_id = d.get("orderbook_id") or d.get("id")
         if ob_id is None:
-            from ...error import DeserializationError
             raise DeserializationError("Missing required field 'orderbook_id' in WsOrderBook")
         return WsOrderBook(
-            orderbook_id=ob_id,
+            # Stream ids repeat on every frame; interning shares one object.
+            orderbook_id=intern(ob_id),
             is_snapshot=d.get("is_snapshot", False),
             seq=d.get("seq", 0),
             resync=d.get("resync", False),
-            bids=[WsBookLevel.from_dict(b) for b in d.get("bids", [])],
-            asks=[WsBookLevel.from_dict(a) for a in d.get("asks", [])],
+            bids=_ws_book_levels(d.get("bids", ())),
+            asks=_ws_book_levels(d.get("asks", ())),
         )
 
 
@@ -157,7 +177,7 @@ class DecimalsResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WsTickerData:
     orderbook_id: str
     best_bid: Optional[str] = None
@@ -168,7 +188,7 @@ class WsTickerData:
     @staticmethod
     def from_dict(d: dict) -> "WsTickerData":
         return WsTickerData(
-            orderbook_id=d.get("orderbook_id", ""),
+            orderbook_id=intern(d.get("orderbook_id", "")),
             best_bid=d.get("best_bid"),
             best_ask=d.get("best_ask"),
             mid_price=d.get("mid_price") or d.get("mid"),
@@ -1,26 +1,28 @@
 """Price history domain types."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LineData:
     """Single price point for charting."""
     time: int
     value: str
 
 
-@dataclass
-class PriceHistoryKey:
-    """Key for price history lookups."""
+class PriceHistoryKey(NamedTuple):
+    """Key for price history lookups.
+
+    A plain ``(orderbook_id, resolution)`` tuple, so it hashes and compares
+    equal to the tuple keys used by ``PriceHistoryState``.
+    """
     orderbook_id: str
     resolution: str
 
 
-@dataclass
-class DepositPriceKey:
-    """Key for deposit-price lookups."""
+class DepositPriceKey(NamedTuple):
+    """Key for deposit-price lookups, equal to ``(deposit_asset, resolution)``."""
 
     deposit_asset: str
     resolution: str
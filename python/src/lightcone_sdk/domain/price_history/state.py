@@ -1,5 +1,6 @@
 """Price history state container."""
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -7,10 +8,37 @@ from . import LatestDepositPrice, LineData
 from .wire import DepositTokenCandle
 
 
+def _line_time(point: LineData) -> int:
+    return point.time
+
+
+def _candle_time(candle: DepositTokenCandle) -> int:
+    return candle.t
+
+
+def _trim(series: list, max_points: Optional[int]) -> None:
+    """Cut a series back to its newest ``max_points`` entries.
+
+    Waits until the series is a quarter over the cap, so the O(n) delete
+    from the front runs once per many appends rather than on every one.
+    """
+    if max_points is None:
+        return
+    if len(series) > max_points + max(1, max_points // 4):
+        del series[: len(series) - max_points]
+
+
 @dataclass
 class PriceHistoryState:
-    """State for price history data keyed by (orderbook_id, resolution)."""
+    """State for price history data keyed by (orderbook_id, resolution).
+
+    ``max_points`` optionally bounds how far live updates grow a series; by
+    default series are unbounded. Snapshots are always stored whole. Once
+    updates take a series a quarter past the cap, its oldest points are
+    dropped until ``max_points`` remain.
+    """
     _data: dict[tuple[str, str], list[LineData]] = field(default_factory=dict)
+    max_points: Optional[int] = None
 
     def key(self, orderbook_id: str, resolution: str) -> tuple[str, str]:
         return (orderbook_id, resolution)
@@ -20,15 +48,26 @@ class PriceHistoryState:
         self._data[self.key(orderbook_id, resolution)] = list(prices)
 
     def apply_update(self, orderbook_id: str, resolution: str, point: LineData) -> None:
-        """Append or overwrite the last point if timestamps match."""
+        """Upsert a point, keeping the series ordered by time.
+
+        Updates at or after the last point (the live case) touch only the
+        tail; late points are placed by binary search.
+        """
         k = self.key(orderbook_id, resolution)
         if k not in self._data:
             self._data[k] = []
         series = self._data[k]
-        if series and series[-1].time == point.time:
+        if not series or series[-1].time < point.time:
+            series.append(point)
+        elif series[-1].time == point.time:
             series[-1] = point
         else:
-            series.append(point)
+            i = bisect_left(series, point.time, key=_line_time)
+            if series[i].time == point.time:
+                series[i] = point
+                return
+            series.insert(i, point)
+        _trim(series, self.max_points)
 
     def set(self, orderbook_id: str, resolution: str, data: list[LineData]) -> None:
         """Alias for apply_snapshot."""
@@ -41,6 +80,16 @@ class PriceHistoryState:
     def get(self, orderbook_id: str, resolution: str) -> list[LineData]:
         return self._data.get(self.key(orderbook_id, resolution), [])
 
+    def get_point(self, orderbook_id: str, resolution: str, time: int) -> Optional[LineData]:
+        """The point at exactly ``time``, if present."""
+        series = self._data.get(self.key(orderbook_id, resolution))
+        if not series:
+            return None
+        i = bisect_left(series, time, key=_line_time)
+        if i < len(series) and series[i].time == time:
+            return series[i]
+        return None
+
     def clear(self, orderbook_id: Optional[str] = None, resolution: Optional[str] = None) -> None:
         if orderbook_id and resolution:
             self._data.pop(self.key(orderbook_id, resolution), None)
@@ -50,10 +99,17 @@ class PriceHistoryState:
 
 @dataclass
 class DepositPriceState:
-    """State for deposit-price data keyed by (deposit_asset, resolution)."""
+    """State for deposit-price data keyed by (deposit_asset, resolution).
+
+    ``max_points`` bounds candle series the same way as
+    ``PriceHistoryState.max_points``: unbounded by default, snapshots stored
+    whole, and live updates trimmed back to ``max_points`` once a series is
+    a quarter over it.
+    """
 
     _candles: dict[tuple[str, str], list[DepositTokenCandle]] = field(default_factory=dict)
     _latest_price: dict[str, LatestDepositPrice] = field(default_factory=dict)
+    max_points: Optional[int] = None
 
     def key(self, deposit_asset: str, resolution: str) -> tuple[str, str]:
         return (deposit_asset, resolution)
@@ -77,11 +133,19 @@ class DepositPriceState:
             self._candles[key] = []
 
         series = self._candles[key]
-        if series and series[-1].t == candle.t:
+        if not series or series[-1].t < candle.t:
+            series.append(candle)
+        elif series[-1].t == candle.t:
             series[-1].tc = candle.tc
             series[-1].c = candle.c
         else:
-            series.append(candle)
+            i = bisect_left(series, candle.t, key=_candle_time)
+            if series[i].t == candle.t:
+                series[i].tc = candle.tc
+                series[i].c = candle.c
+                return
+            series.insert(i, candle)
+        _trim(series, self.max_points)
 
     def apply_price_tick(self, deposit_asset: str, price: str, event_time: int) -> None:
         self._latest_price[deposit_asset] = LatestDepositPrice(
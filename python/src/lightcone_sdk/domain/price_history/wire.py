@@ -1,10 +1,11 @@
 """Price history wire types."""
 
 from dataclasses import dataclass, field
+from sys import intern
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceCandle:
     """WS price candle (no best bid/ask)."""
     t: int = 0
@@ -28,7 +29,7 @@ class PriceCandle:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookPriceCandle:
     """REST orderbook price candle (includes best bid/ask)."""
     t: int = 0
@@ -69,13 +70,13 @@ class PriceHistorySnapshot:
         return PriceHistorySnapshot(
             orderbook_id=d.get("orderbook_id", ""),
             resolution=d.get("resolution", "1m"),
-            candles=[PriceCandle.from_dict(c) for c in d.get("candles", d.get("prices", []))],
+            candles=[PriceCandle.from_dict(c) for c in d.get("candles", d.get("prices", ()))],
             last_timestamp=d.get("last_timestamp"),
             server_time=d.get("server_time"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceHistoryUpdate:
     """WS price history update with flat OHLCV fields."""
     orderbook_id: str = ""
@@ -93,8 +94,8 @@ class PriceHistoryUpdate:
     @staticmethod
     def from_dict(d: dict) -> "PriceHistoryUpdate":
         return PriceHistoryUpdate(
-            orderbook_id=d.get("orderbook_id", ""),
-            resolution=d.get("resolution", "1m"),
+            orderbook_id=intern(d.get("orderbook_id", "")),
+            resolution=intern(d.get("resolution", "1m")),
             t=d.get("t", 0),
             m=d.get("m"),
             o=d.get("o"),
@@ -107,7 +108,7 @@ class PriceHistoryUpdate:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceHistoryHeartbeat:
     server_time: int = 0
     last_processed: Optional[int] = None
@@ -136,14 +137,14 @@ class OrderbookPriceHistoryResponse:
             orderbook_id=d.get("orderbook_id", ""),
             resolution=d.get("resolution", "1m"),
             include_ohlcv=d.get("include_ohlcv", False),
-            prices=[OrderbookPriceCandle.from_dict(c) for c in d.get("prices", [])],
+            prices=[OrderbookPriceCandle.from_dict(c) for c in d.get("prices", ())],
             next_cursor=d.get("next_cursor"),
             has_more=d.get("has_more", False),
             decimals=d.get("decimals") or {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositTokenCandle:
     t: int = 0
     tc: int = 0
@@ -171,11 +172,11 @@ class DepositPriceSnapshot:
         return DepositPriceSnapshot(
             deposit_asset=d.get("deposit_asset", ""),
             resolution=d.get("resolution", "1m"),
-            prices=[DepositTokenCandle.from_dict(c) for c in d.get("prices", [])],
+            prices=[DepositTokenCandle.from_dict(c) for c in d.get("prices", ())],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositPriceTick:
     """Real-time spot price tick, broadcast to all resolutions."""
 
@@ -192,7 +193,7 @@ class DepositPriceTick:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositPriceCandleUpdate:
     """A single candle update for a specific resolution (e.g. a 1m candle closed)."""
 
@@ -228,7 +229,7 @@ class DepositPriceHistoryResponse:
             deposit_asset=d.get("deposit_asset", ""),
             binance_symbol=d.get("binance_symbol", ""),
             resolution=d.get("resolution", "1m"),
-            prices=[DepositTokenCandle.from_dict(c) for c in d.get("prices", [])],
+            prices=[DepositTokenCandle.from_dict(c) for c in d.get("prices", ())],
             next_cursor=d.get("next_cursor"),
             has_more=d.get("has_more", False),
         )
@@ -268,7 +269,7 @@ class DepositAssetPriceSnapshot:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepositAssetPriceTick:
     """Live price tick payload for one deposit asset."""
 
@@ -2,7 +2,7 @@
 
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 from . import Trade
 
 
@@ -64,6 +64,10 @@ class TradeHistory:
             self._trades.append(t)
 
     def trades(self) -> list[Trade]:
+        """Copy of the buffered trades, oldest first.
+
+        Iterate the history directly to read without copying.
+        """
         return list(self._trades)
 
     def all(self) -> list[Trade]:
@@ -73,6 +77,9 @@ class TradeHistory:
     def latest(self) -> Optional[Trade]:
         return self._trades[-1] if self._trades else None
 
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(self._trades)
+
     def __len__(self) -> int:
         return len(self._trades)
 
@@ -1,6 +1,7 @@
 """Trade wire types."""
 
 from dataclasses import dataclass
+from sys import intern
 from typing import Optional
 
 from ...error import _require
@@ -77,7 +78,7 @@ class TradesResponseWire:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WsTrade:
     orderbook_id: str
     price: str
@@ -91,7 +92,7 @@ class WsTrade:
     @staticmethod
     def from_dict(d: dict) -> "WsTrade":
         return WsTrade(
-            orderbook_id=_require(d, "orderbook_id", "WsTrade"),
+            orderbook_id=intern(_require(d, "orderbook_id", "WsTrade")),
             price=str(d.get("price", "0")),
             size=str(d.get("size", "0")),
             side=d.get("side", 0),
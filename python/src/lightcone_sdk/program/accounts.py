@@ -1,5 +1,9 @@
 """Account deserialization for the Lightcone SDK."""
 
+import struct
+
+from solders.pubkey import Pubkey
+
 from .constants import (
     EXCHANGE_DISCRIMINATOR,
     EXCHANGE_SIZE,
@@ -27,23 +31,26 @@ from .types import (
     Position,
     UserNonce,
 )
-from .utils import (
-    decode_bool,
-    decode_pubkey,
-    decode_u8,
-    decode_u16,
-    decode_u32,
-    decode_u64,
-)
+
+# One precompiled layout per account, each decoding every field after the
+# 8-byte discriminator in a single unpack_from call. Sizes match the
+# *_SIZE constants; bools are "?" (any non-zero byte is true).
+_EXCHANGE_LAYOUT = struct.Struct("<8x32s32s32sQ?BH4x")
+_MARKET_LAYOUT = struct.Struct("<8xQBBB5x32s32s32s6II")
+_POSITION_LAYOUT = struct.Struct("<8x32s32sB7x")
+_ORDER_STATUS_LAYOUT = struct.Struct("<8xQQ?7x")
+_USER_NONCE_LAYOUT = struct.Struct("<8xQ")
+_ORDERBOOK_LAYOUT = struct.Struct("<8x32s32s32s32sBB6x")
+_GLOBAL_DEPOSIT_TOKEN_LAYOUT = struct.Struct("<8x32s?BH4x")
 
 
 def _validate_discriminator(data: bytes, expected: bytes, name: str) -> None:
     """Validate account discriminator."""
     if len(data) < 8:
         raise InvalidAccountDataError(f"{name} data too short: {len(data)} bytes")
-    actual = data[:8]
-    if actual != expected:
-        raise InvalidDiscriminatorError(expected, actual)
+    # startswith compares in place; only the error path slices.
+    if not data.startswith(expected):
+        raise InvalidDiscriminatorError(expected, data[:8])
 
 
 def deserialize_exchange(data: bytes) -> Exchange:
@@ -67,14 +74,17 @@ def deserialize_exchange(data: bytes) -> Exchange:
             f"Exchange data too short: {len(data)} bytes (expected {EXCHANGE_SIZE})"
         )
 
+    authority, operator, manager, market_count, paused, bump, deposit_token_count = (
+        _EXCHANGE_LAYOUT.unpack_from(data)
+    )
     return Exchange(
-        authority=decode_pubkey(data, 8),
-        operator=decode_pubkey(data, 40),
-        manager=decode_pubkey(data, 72),
-        market_count=decode_u64(data, 104),
-        paused=decode_bool(data, 112),
-        bump=decode_u8(data, 113),
-        deposit_token_count=decode_u16(data, 114),
+        authority=Pubkey.from_bytes(authority),
+        operator=Pubkey.from_bytes(operator),
+        manager=Pubkey.from_bytes(manager),
+        market_count=market_count,
+        paused=paused,
+        bump=bump,
+        deposit_token_count=deposit_token_count,
     )
 
 
@@ -101,23 +111,17 @@ def deserialize_market(data: bytes) -> Market:
             f"Market data too short: {len(data)} bytes (expected {MARKET_SIZE})"
         )
 
+    fields = _MARKET_LAYOUT.unpack_from(data)
     return Market(
-        market_id=decode_u64(data, 8),
-        num_outcomes=decode_u8(data, 16),
-        status=MarketStatus(decode_u8(data, 17)),
-        bump=decode_u8(data, 18),
-        oracle=decode_pubkey(data, 24),
-        question_id=data[56:88],
-        condition_id=data[88:120],
-        payout_numerators=(
-            decode_u32(data, 120),
-            decode_u32(data, 124),
-            decode_u32(data, 128),
-            decode_u32(data, 132),
-            decode_u32(data, 136),
-            decode_u32(data, 140),
-        ),
-        payout_denominator=decode_u32(data, 144),
+        market_id=fields[0],
+        num_outcomes=fields[1],
+        status=MarketStatus(fields[2]),
+        bump=fields[3],
+        oracle=Pubkey.from_bytes(fields[4]),
+        question_id=fields[5],
+        condition_id=fields[6],
+        payout_numerators=fields[7:13],
+        payout_denominator=fields[13],
     )
 
 
@@ -138,10 +142,11 @@ def deserialize_position(data: bytes) -> Position:
             f"Position data too short: {len(data)} bytes (expected {POSITION_SIZE})"
         )
 
+    owner, market, bump = _POSITION_LAYOUT.unpack_from(data)
     return Position(
-        owner=decode_pubkey(data, 8),
-        market=decode_pubkey(data, 40),
-        bump=decode_u8(data, 72),
+        owner=Pubkey.from_bytes(owner),
+        market=Pubkey.from_bytes(market),
+        bump=bump,
     )
 
 
@@ -162,10 +167,11 @@ def deserialize_order_status(data: bytes) -> OrderStatus:
             f"OrderStatus data too short: {len(data)} bytes (expected {ORDER_STATUS_SIZE})"
         )
 
+    remaining, base_remaining, is_cancelled = _ORDER_STATUS_LAYOUT.unpack_from(data)
     return OrderStatus(
-        remaining=decode_u64(data, 8),
-        base_remaining=decode_u64(data, 16),
-        is_cancelled=decode_bool(data, 24),
+        remaining=remaining,
+        base_remaining=base_remaining,
+        is_cancelled=is_cancelled,
     )
 
 
@@ -183,8 +189,9 @@ def deserialize_user_nonce(data: bytes) -> UserNonce:
             f"UserNonce data too short: {len(data)} bytes (expected {USER_NONCE_SIZE})"
         )
 
+    (nonce,) = _USER_NONCE_LAYOUT.unpack_from(data)
     return UserNonce(
-        nonce=decode_u64(data, 8),
+        nonce=nonce,
     )
 
 
@@ -208,49 +215,52 @@ def deserialize_orderbook(data: bytes) -> Orderbook:
             f"Orderbook data too short: {len(data)} bytes (expected {ORDERBOOK_SIZE})"
         )
 
+    market, mint_a, mint_b, lookup_table, base_index, bump = (
+        _ORDERBOOK_LAYOUT.unpack_from(data)
+    )
     return Orderbook(
-        market=decode_pubkey(data, 8),
-        mint_a=decode_pubkey(data, 40),
-        mint_b=decode_pubkey(data, 72),
-        lookup_table=decode_pubkey(data, 104),
-        base_index=decode_u8(data, 136),
-        bump=decode_u8(data, 137),
+        market=Pubkey.from_bytes(market),
+        mint_a=Pubkey.from_bytes(mint_a),
+        mint_b=Pubkey.from_bytes(mint_b),
+        lookup_table=Pubkey.from_bytes(lookup_table),
+        base_index=base_index,
+        bump=bump,
     )
 
 
 def is_exchange_account(data: bytes) -> bool:
     """Check if data has the Exchange discriminator."""
-    return len(data) >= 8 and data[:8] == EXCHANGE_DISCRIMINATOR
+    return data.startswith(EXCHANGE_DISCRIMINATOR)
 
 
 def is_market_account(data: bytes) -> bool:
     """Check if data has the Market discriminator."""
-    return len(data) >= 8 and data[:8] == MARKET_DISCRIMINATOR
+    return data.startswith(MARKET_DISCRIMINATOR)
 
 
 def is_position_account(data: bytes) -> bool:
     """Check if data has the Position discriminator."""
-    return len(data) >= 8 and data[:8] == POSITION_DISCRIMINATOR
+    return data.startswith(POSITION_DISCRIMINATOR)
 
 
 def is_order_status_account(data: bytes) -> bool:
     """Check if data has the OrderStatus discriminator."""
-    return len(data) >= 8 and data[:8] == ORDER_STATUS_DISCRIMINATOR
+    return data.startswith(ORDER_STATUS_DISCRIMINATOR)
 
 
 def is_user_nonce_account(data: bytes) -> bool:
     """Check if data has the UserNonce discriminator."""
-    return len(data) >= 8 and data[:8] == USER_NONCE_DISCRIMINATOR
+    return data.startswith(USER_NONCE_DISCRIMINATOR)
 
 
 def is_orderbook_account(data: bytes) -> bool:
     """Check if data has the Orderbook discriminator."""
-    return len(data) >= 8 and data[:8] == ORDERBOOK_DISCRIMINATOR
+    return data.startswith(ORDERBOOK_DISCRIMINATOR)
 
 
 def is_global_deposit_token(data: bytes) -> bool:
     """Check if data has the GlobalDepositToken discriminator."""
-    return len(data) >= 8 and data[:8] == GLOBAL_DEPOSIT_TOKEN_DISCRIMINATOR
+    return data.startswith(GLOBAL_DEPOSIT_TOKEN_DISCRIMINATOR)
 
 
 def deserialize_global_deposit_token(data: bytes) -> GlobalDepositToken:
@@ -273,9 +283,10 @@ def deserialize_global_deposit_token(data: bytes) -> GlobalDepositToken:
             f"GlobalDepositToken data too short: {len(data)} bytes (expected {GLOBAL_DEPOSIT_TOKEN_SIZE})"
         )
 
+    mint, active, bump, index = _GLOBAL_DEPOSIT_TOKEN_LAYOUT.unpack_from(data)
     return GlobalDepositToken(
-        mint=decode_pubkey(data, 8),
-        active=decode_bool(data, 40),
-        bump=decode_u8(data, 41),
-        index=decode_u16(data, 42),
+        mint=Pubkey.from_bytes(mint),
+        active=active,
+        bump=bump,
+        index=index,
     )
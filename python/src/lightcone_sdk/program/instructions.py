@@ -724,7 +724,6 @@ def build_match_orders_multi_instruction(
     exchange, _ = get_exchange_pda(program_id)
     orderbook, _ = get_orderbook_pda(base_mint, quote_mint, program_id)
 
-    taker_hash = hash_order(taker_order)
     taker_nonce, _ = get_user_nonce_pda(taker_order.maker, program_id)
     taker_position, _ = get_position_pda(taker_order.maker, market, program_id)
 
@@ -746,6 +745,7 @@ def build_match_orders_multi_instruction(
 
     # Taker order_status: only if NOT full fill (bit 7 = 0)
     if not taker_full_fill:
+        taker_hash = hash_order(taker_order)
         taker_order_status, _ = get_order_status_pda(taker_hash, program_id)
         accounts.append(
             AccountMeta(pubkey=taker_order_status, is_signer=False, is_writable=True)
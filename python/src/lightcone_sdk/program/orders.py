@@ -4,6 +4,7 @@ import os
 import time
 import uuid
 
+import base58
 import nacl.exceptions
 from nacl.signing import SigningKey, VerifyKey
 from solders.keypair import Keypair
@@ -517,7 +518,6 @@ def is_order_expired(order: SignedOrder, current_time: int) -> bool:
 
 def apply_signature(order: SignedOrder, sig_bs58: str) -> None:
     """Apply a base58-encoded signature to an order in place."""
-    import base58
     sig_bytes = base58.b58decode(sig_bs58)
     if len(sig_bytes) != SIGNATURE_SIZE:
         raise InvalidSignatureError(
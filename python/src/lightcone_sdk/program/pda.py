@@ -1,5 +1,7 @@
 """PDA (Program Derived Address) derivation functions for the Lightcone SDK."""
 
+from functools import lru_cache
+
 from solders.pubkey import Pubkey
 
 from ..env import PROGRAM_ID
@@ -17,9 +19,15 @@ from .constants import (
     SEED_USER_NONCE,
     SEED_VAULT,
 )
-from .utils import encode_u8, encode_u64
+from .utils import _PDA_CACHE_SIZE, encode_u8, encode_u64
+
+# find_program_address hashes seeds once per bump tried, and derivation is
+# deterministic, so PDAs keyed on long-lived accounts (exchange, markets,
+# mints, users) are memoized. Per-order and per-slot PDAs are not: their
+# inputs rarely repeat.
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_exchange_pda(program_id: Pubkey = PROGRAM_ID) -> tuple[Pubkey, int]:
     """Derive the exchange PDA.
 
@@ -28,6 +36,7 @@ def get_exchange_pda(program_id: Pubkey = PROGRAM_ID) -> tuple[Pubkey, int]:
     return Pubkey.find_program_address([SEED_CENTRAL_STATE], program_id)
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_market_pda(
     market_id: int,
     program_id: Pubkey = PROGRAM_ID,
@@ -56,6 +65,7 @@ def get_condition_tombstone_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_vault_pda(
     deposit_mint: Pubkey,
     market: Pubkey,
@@ -71,6 +81,7 @@ def get_vault_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_mint_authority_pda(
     market: Pubkey,
     program_id: Pubkey = PROGRAM_ID,
@@ -85,6 +96,7 @@ def get_mint_authority_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_conditional_mint_pda(
     market: Pubkey,
     deposit_mint: Pubkey,
@@ -120,6 +132,7 @@ def get_order_status_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_user_nonce_pda(
     user: Pubkey,
     program_id: Pubkey = PROGRAM_ID,
@@ -134,6 +147,7 @@ def get_user_nonce_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_position_pda(
     owner: Pubkey,
     market: Pubkey,
@@ -156,6 +170,7 @@ def canonical_mint_pair(mint_a: Pubkey, mint_b: Pubkey) -> tuple[Pubkey, Pubkey]
     return mint_b, mint_a
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_orderbook_pda(
     mint_a: Pubkey,
     mint_b: Pubkey,
@@ -172,6 +187,7 @@ def get_orderbook_pda(
     )
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_global_deposit_pda(
     mint: Pubkey,
     program_id: Pubkey = PROGRAM_ID,
@@ -226,6 +242,7 @@ def get_all_conditional_mints(
     ]
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_user_global_deposit_pda(
     user: Pubkey,
     mint: Pubkey,
@@ -1,6 +1,7 @@
 """Utility functions for the Lightcone program module."""
 
 import struct
+from functools import lru_cache
 from math import gcd
 from typing import Union
 
@@ -28,6 +29,10 @@ from .types import ScalarResolutionParams
 
 U32_MAX = 0xFFFFFFFF
 
+# Upper bound for memoized address derivations (see pda.py). Derivation is
+# deterministic, and each miss pays a find_program_address bump search.
+_PDA_CACHE_SIZE = 4096
+
 
 def keccak256(data: bytes) -> bytes:
     """Compute keccak256 hash of data."""
@@ -152,6 +157,7 @@ def pubkey_to_bytes(pubkey: Union[Pubkey, bytes]) -> bytes:
     return bytes(pubkey)
 
 
+@lru_cache(maxsize=_PDA_CACHE_SIZE)
 def get_associated_token_address(
     owner: Pubkey,
     mint: Pubkey,
@@ -21,8 +21,24 @@ def format_decimal(value: Decimal | float | str, precision: int = 6) -> str:
     return format(quantized, "f")
 
 
+# Zero spellings seen in wire payloads; checked before any parsing.
+_ZERO_LITERALS = frozenset(("0", "0.0", "0.00", "0.000", "0.000000", "0.000000000"))
+
+
 def is_zero(value: str) -> bool:
-    """Check if a decimal string represents zero."""
+    """Check if a decimal string represents zero.
+
+    Plain decimal strings are decided with string operations alone;
+    ``Decimal`` is only constructed for other spellings such as ``"0E-9"``.
+    """
+    if isinstance(value, str):
+        if value in _ZERO_LITERALS:
+            return True
+        stripped = value.strip("0")
+        if stripped.replace(".", "", 1).isdigit():
+            return False
+        if stripped in ("", ".") and value not in ("", "."):
+            return True
     try:
         return Decimal(value) == 0
     except Exception:
@@ -3,42 +3,48 @@
 import json
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from typing import Any, Callable, Optional, TYPE_CHECKING, Union
-
+from typing import Any, Callable, Optional, Union
+
+from ..domain.market.wire import MarketEvent
+from ..domain.order.wire import AuthUpdate, UserUpdate
+from ..domain.orderbook.wire import WsOrderBook, WsTickerData
+from ..domain.price_history.wire import (
+    DepositAssetPriceSnapshot,
+    DepositAssetPriceTick,
+    DepositPriceCandleUpdate,
+    DepositPriceSnapshot,
+    DepositPriceTick,
+    PriceHistoryHeartbeat,
+    PriceHistorySnapshot,
+    PriceHistoryUpdate,
+)
+from ..domain.trade.wire import WsTrade
 from ..env import LightconeEnv
 
-if TYPE_CHECKING:
-    from ..domain.price_history.wire import (
-        DepositAssetPriceSnapshot,
-        DepositAssetPriceTick,
-        DepositPriceCandleUpdate,
-        DepositPriceSnapshot,
-        DepositPriceTick,
-        PriceHistorySnapshot,
-        PriceHistoryUpdate,
-        PriceHistoryHeartbeat,
-    )
-    from ..domain.orderbook.wire import WsOrderBook, WsTickerData
-    from ..domain.order.wire import UserUpdate, AuthUpdate
-    from ..domain.trade.wire import WsTrade
-    from ..domain.market.wire import MarketEvent
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    # orjson is an optional speedup for inbound frames; it accepts str or bytes
+    # and raises a json.JSONDecodeError subclass, so callers see no difference.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 MessageData = Union[
-    "WsOrderBook",
-    "UserUpdate",
+    WsOrderBook,
+    UserUpdate,
     "WsErrorData",
-    "WsTrade",
-    "AuthUpdate",
-    "WsTickerData",
-    "MarketEvent",
-    "PriceHistorySnapshot",
-    "PriceHistoryUpdate",
-    "PriceHistoryHeartbeat",
-    "DepositPriceSnapshot",
-    "DepositPriceTick",
-    "DepositPriceCandleUpdate",
-    "DepositAssetPriceSnapshot",
-    "DepositAssetPriceTick",
+    WsTrade,
+    AuthUpdate,
+    WsTickerData,
+    MarketEvent,
+    PriceHistorySnapshot,
+    PriceHistoryUpdate,
+    PriceHistoryHeartbeat,
+    DepositPriceSnapshot,
+    DepositPriceTick,
+    DepositPriceCandleUpdate,
+    DepositAssetPriceSnapshot,
+    DepositAssetPriceTick,
     dict,
 ]
 
@@ -227,7 +233,7 @@ class MessageInType(str, Enum):
     DEPOSIT_ASSET_PRICE = "deposit_asset_price"
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageIn:
     """Parsed incoming WebSocket message."""
 
@@ -250,91 +256,46 @@ class MessageIn:
         )
 
 
-def parse_message_in(text: str) -> MessageIn:
-    """Parse a raw WebSocket text message."""
-    data = json.loads(text)
+def parse_message_in(text: Union[str, bytes]) -> MessageIn:
+    """Parse a raw WebSocket text or binary frame."""
+    data = _json_loads(text)
     return MessageIn.from_dict(data)
 
 
 def _parse_message_data(message_type: str, data: Any) -> Optional[MessageData]:
     if not isinstance(data, dict):
         return data
+    parser = _MESSAGE_PARSERS.get(message_type)
+    if parser is None:
+        return data
+    return parser(data)
 
-    if message_type == MessageInType.BOOK_UPDATE.value:
-        from ..domain.orderbook.wire import WsOrderBook
-
-        return WsOrderBook.from_dict(data)
-
-    if message_type == MessageInType.USER.value:
-        from ..domain.order.wire import UserUpdate
-
-        return UserUpdate.from_dict(data)
-
-    if message_type == MessageInType.ERROR.value:
-        return WsErrorData.from_dict(data)
-
-    if message_type == MessageInType.PRICE_HISTORY.value:
-        from ..domain.price_history.wire import (
-            PriceHistoryHeartbeat,
-            PriceHistorySnapshot,
-            PriceHistoryUpdate,
-        )
-
-        event_type = data.get("event_type", "")
-        if event_type == "update" or (not event_type and "t" in data):
-            return PriceHistoryUpdate.from_dict(data)
-        if event_type == "heartbeat" or (
-            not event_type and "server_time" in data and "orderbook_id" not in data
-        ):
-            return PriceHistoryHeartbeat.from_dict(data)
-        return PriceHistorySnapshot.from_dict(data)
-
-    if message_type == MessageInType.TRADES.value:
-        from ..domain.trade.wire import WsTrade
-
-        return WsTrade.from_dict(data)
-
-    if message_type == MessageInType.AUTH.value:
-        from ..domain.order.wire import AuthUpdate
-
-        return AuthUpdate.from_dict(data)
-
-    if message_type == MessageInType.TICKER.value:
-        from ..domain.orderbook.wire import WsTickerData
-
-        return WsTickerData.from_dict(data)
-
-    if message_type == MessageInType.MARKET.value:
-        from ..domain.market.wire import MarketEvent
 
-        return MarketEvent.from_dict(data)
+def _parse_price_history(data: dict) -> MessageData:
+    event_type = data.get("event_type", "")
+    if event_type == "update" or (not event_type and "t" in data):
+        return PriceHistoryUpdate.from_dict(data)
+    if event_type == "heartbeat" or (
+        not event_type and "server_time" in data and "orderbook_id" not in data
+    ):
+        return PriceHistoryHeartbeat.from_dict(data)
+    return PriceHistorySnapshot.from_dict(data)
 
-    if message_type == MessageInType.DEPOSIT_PRICE.value:
-        from ..domain.price_history.wire import (
-            DepositPriceCandleUpdate,
-            DepositPriceSnapshot,
-            DepositPriceTick,
-        )
 
-        event_type = data.get("event_type", "")
-        if event_type == "price":
-            return DepositPriceTick.from_dict(data)
-        if event_type == "candle":
-            return DepositPriceCandleUpdate.from_dict(data)
-        return DepositPriceSnapshot.from_dict(data)
-
-    if message_type == MessageInType.DEPOSIT_ASSET_PRICE.value:
-        from ..domain.price_history.wire import (
-            DepositAssetPriceSnapshot,
-            DepositAssetPriceTick,
-        )
+def _parse_deposit_price(data: dict) -> MessageData:
+    event_type = data.get("event_type", "")
+    if event_type == "price":
+        return DepositPriceTick.from_dict(data)
+    if event_type == "candle":
+        return DepositPriceCandleUpdate.from_dict(data)
+    return DepositPriceSnapshot.from_dict(data)
 
-        event_type = data.get("event_type", "")
-        if event_type == "price":
-            return DepositAssetPriceTick.from_dict(data)
-        return DepositAssetPriceSnapshot.from_dict(data)
 
-    return data
+def _parse_deposit_asset_price(data: dict) -> MessageData:
+    event_type = data.get("event_type", "")
+    if event_type == "price":
+        return DepositAssetPriceTick.from_dict(data)
+    return DepositAssetPriceSnapshot.from_dict(data)
 
 
 # ---------------------------------------------------------------------------
@@ -342,9 +303,13 @@ def _parse_message_data(message_type: str, data: Any) -> Optional[MessageData]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WsConfig:
-    """WebSocket client configuration."""
+    """WebSocket client configuration.
+
+    Immutable: the module-level ``WS_DEFAULT_CONFIG`` instance is shared by
+    every client, so use ``dataclasses.replace`` to derive a variant.
+    """
 
     url: str = LightconeEnv.PROD.ws_url
     reconnect: bool = True
@@ -427,6 +392,22 @@ class WsErrorData:
         )
 
 
+# Raw ``type`` string -> payload parser, so dispatch is one dict lookup.
+# Built after WsErrorData so every parser is already defined.
+_MESSAGE_PARSERS: dict[str, Callable[[dict], MessageData]] = {
+    MessageInType.BOOK_UPDATE.value: WsOrderBook.from_dict,
+    MessageInType.USER.value: UserUpdate.from_dict,
+    MessageInType.ERROR.value: WsErrorData.from_dict,
+    MessageInType.PRICE_HISTORY.value: _parse_price_history,
+    MessageInType.TRADES.value: WsTrade.from_dict,
+    MessageInType.AUTH.value: AuthUpdate.from_dict,
+    MessageInType.TICKER.value: WsTickerData.from_dict,
+    MessageInType.MARKET.value: MarketEvent.from_dict,
+    MessageInType.DEPOSIT_PRICE.value: _parse_deposit_price,
+    MessageInType.DEPOSIT_ASSET_PRICE.value: _parse_deposit_asset_price,
+}
+
+
 __all__ = [
     # Outgoing message helpers
     "ping",
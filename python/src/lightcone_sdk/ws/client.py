@@ -4,6 +4,9 @@ import asyncio
 import json
 import logging
 import random
+import time
+from collections import deque
+from dataclasses import asdict
 from typing import Any, Callable, Optional
 
 import aiohttp
@@ -24,25 +27,55 @@ from .subscriptions import SubscribeParams, UserParams, subscription_key
 
 logger = logging.getLogger(__name__)
 
+# Both frame kinds carry JSON; parse_message_in accepts str or bytes, so no
+# per-frame decode or type branch is needed between them.
+_DATA_FRAMES = frozenset({aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY})
+_CLOSE_FRAMES = frozenset({aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING})
+
+# Upper bound on what the writer sends per wake before yielding to the loop,
+# so a large resubscribe burst cannot starve the receive task.
+_WRITE_BATCH_FRAMES = 100
+_WRITE_BATCH_BYTES = 64 * 1024
+
+# The heartbeat payload never changes, so it is serialized once at import.
+_PING_FRAME = json.dumps(make_ping())
+
+# Tasks that live exactly as long as one socket.
+_CONNECTION_TASKS = ("_ping_task", "_pong_timeout_task", "_receive_task", "_writer_task")
+
 
 class WsClient:
-    """Async WebSocket client with reconnection and subscription tracking."""
+    """Async WebSocket client with reconnection and subscription tracking.
+
+    All connection state is owned by the event loop the client runs on and is
+    only mutated between awaits, so it is deliberately not guarded by locks.
+    """
 
     def __init__(self, config: Optional[WsConfig] = None):
         self._config = config or WS_DEFAULT_CONFIG
         self._session: Optional[aiohttp.ClientSession] = None
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._state = ReadyState.CLOSED
-        self._callbacks: list[Callable[[WsEvent], Any]] = []
-        self._active_subscriptions: list[SubscribeParams] = []
+        # Replaced (never mutated) on on()/unsubscribe, so _emit iterates a
+        # stable snapshot even if a callback unsubscribes mid-dispatch.
+        self._callbacks: tuple[Callable[[WsEvent], Any], ...] = ()
+        # subscription_key -> (params, serialized subscribe frame). The frame
+        # is built once so reconnects replay it without re-serializing.
+        self._active_subscriptions: dict[str, tuple[SubscribeParams, str]] = {}
         self._reconnect_attempts = 0
+        self._prev_reconnect_delay_ms = self._config.base_reconnect_delay_ms
         self._ping_task: Optional[asyncio.Task] = None
         self._pong_timeout_task: Optional[asyncio.Task] = None
         self._receive_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._outbound: deque[str] = deque()
+        self._outbound_waker: Optional[asyncio.Event] = None
         self._should_reconnect = False
         self._auth_token: Optional[str] = None
-        self._pending_messages: list[dict] = []
-        self._awaiting_pong = False
+        self._cookie_header: Optional[str] = None
+        self._pending_messages: list[str] = []
+        self._last_ping_mono = 0.0
+        self._last_pong_mono = 0.0
 
     def ready_state(self) -> ReadyState:
         return self._state
@@ -52,14 +85,18 @@ class WsClient:
 
     def set_auth_token(self, token: Optional[str]) -> None:
         self._auth_token = token
+        # Built once per token rather than on every (re)connect.
+        self._cookie_header = f"auth_token={token}" if token else None
 
     def on(self, callback: Callable[[WsEvent], Any]) -> Callable[[], None]:
         """Register an event callback. Returns an unsubscribe function."""
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
 
         def unsubscribe():
-            if callback in self._callbacks:
-                self._callbacks.remove(callback)
+            callbacks = self._callbacks
+            if callback in callbacks:
+                index = callbacks.index(callback)
+                self._callbacks = callbacks[:index] + callbacks[index + 1:]
 
         return unsubscribe
 
@@ -71,7 +108,7 @@ class WsClient:
                     task = asyncio.ensure_future(result)
                     task.add_done_callback(self._handle_callback_error)
             except Exception as e:
-                logger.warning(f"Callback error: {e}")
+                logger.warning("Callback error: %s", e)
 
     @staticmethod
     def _handle_callback_error(task: asyncio.Task) -> None:
@@ -79,7 +116,7 @@ class WsClient:
             return
         exc = task.exception()
         if exc is not None:
-            logger.warning(f"Async callback error: {exc}")
+            logger.warning("Async callback error: %s", exc)
 
     async def connect(self) -> None:
         """Connect to the WebSocket server."""
@@ -92,8 +129,8 @@ class WsClient:
         try:
             self._session = aiohttp.ClientSession()
             headers: dict[str, str] = {}
-            if self._auth_token:
-                headers["Cookie"] = f"auth_token={self._auth_token}"
+            if self._cookie_header:
+                headers["Cookie"] = self._cookie_header
 
             self._ws = await self._session.ws_connect(
                 self._config.url,
@@ -101,20 +138,27 @@ class WsClient:
             )
             self._state = ReadyState.OPEN
             self._reconnect_attempts = 0
+            self._prev_reconnect_delay_ms = self._config.base_reconnect_delay_ms
+            self._last_pong_mono = time.monotonic()
 
             self._emit(WsEvent(type=WsEventType.CONNECTED))
 
-            # Re-subscribe to tracked subscriptions
-            for sub_params in self._active_subscriptions:
-                msg = _subscribe_params_to_message(sub_params)
-                await self._send_raw(msg)
+            # Frames queued for a previous socket are dropped; tracked
+            # subscriptions are replayed below instead.
+            self._outbound.clear()
+            self._outbound_waker = asyncio.Event()
 
-            # Send pending messages
-            for msg in self._pending_messages:
-                await self._send_raw(msg)
+            # Re-subscribe to tracked subscriptions, then send pending
+            # messages; queued in bulk with a single writer wake-up.
+            outbound = self._outbound
+            outbound.extend(frame for _, frame in self._active_subscriptions.values())
+            outbound.extend(self._pending_messages)
             self._pending_messages.clear()
+            if outbound:
+                self._outbound_waker.set()
 
-            # Start receive loop and ping
+            # Start writer, receive loop and ping
+            self._writer_task = asyncio.ensure_future(self._writer_loop())
             self._receive_task = asyncio.ensure_future(self._receive_loop())
             self._ping_task = asyncio.ensure_future(self._ping_loop())
 
@@ -131,13 +175,14 @@ class WsClient:
         self._should_reconnect = False
         self._state = ReadyState.CLOSING
 
-        self._cancel_task("_ping_task")
-        self._cancel_task("_pong_timeout_task")
-        self._cancel_task("_receive_task")
+        tasks = self._cancel_connection_tasks()
 
         if self._ws and not self._ws.closed:
             await self._ws.close()
 
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -165,47 +210,95 @@ class WsClient:
     def clear_authed_subscriptions(self) -> None:
         """Remove authenticated subscriptions (e.g. User channel) from tracking."""
         before = len(self._active_subscriptions)
-        self._active_subscriptions = [
-            s for s in self._active_subscriptions
-            if not isinstance(s, UserParams)
-        ]
+        self._active_subscriptions = {
+            key: entry
+            for key, entry in self._active_subscriptions.items()
+            if not isinstance(entry[0], UserParams)
+        }
         removed = before - len(self._active_subscriptions)
         if removed > 0:
-            logger.info(f"Cleared {removed} authenticated subscription(s)")
+            logger.info("Cleared %d authenticated subscription(s)", removed)
 
     async def send(self, message: dict) -> None:
         """Send a message. Queues if not connected."""
-        if self._state == ReadyState.OPEN:
-            await self._send_raw(message)
-        else:
-            self._pending_messages.append(message)
+        self._send_frame(json.dumps(message))
 
     async def subscribe(self, params: SubscribeParams) -> None:
         """Subscribe to a channel. Tracks subscription for reconnection."""
         # Track using SubscribeParams-based dedup
-        if not any(subscription_key(s) == subscription_key(params) for s in self._active_subscriptions):
-            self._active_subscriptions.append(params)
+        key = subscription_key(params)
+        entry = self._active_subscriptions.get(key)
+        if entry is None:
+            entry = (params, json.dumps(_subscribe_params_to_message(params)))
+            self._active_subscriptions[key] = entry
 
-        message = _subscribe_params_to_message(params)
-        await self.send(message)
+        self._send_frame(entry[1])
 
     async def unsubscribe(self, params: SubscribeParams) -> None:
         """Unsubscribe from a channel."""
-        key = subscription_key(params)
-        self._active_subscriptions = [
-            s for s in self._active_subscriptions
-            if subscription_key(s) != key
-        ]
+        self._active_subscriptions.pop(subscription_key(params), None)
         message = _unsubscribe_params_to_message(params)
         await self.send(message)
 
-    async def _send_raw(self, message: dict) -> None:
-        """Send raw message to WebSocket."""
-        if self._ws and not self._ws.closed:
-            try:
-                await self._ws.send_json(message)
-            except Exception as e:
-                logger.warning(f"Send failed: {e}")
+    def _send_frame(self, frame: str) -> None:
+        """Queue a serialized frame now, or hold it until the next connect."""
+        if self._state == ReadyState.OPEN:
+            self._enqueue_frame(frame)
+        else:
+            self._pending_messages.append(frame)
+
+    def _enqueue_frame(self, frame: str, priority: bool = False) -> None:
+        """Append a serialized frame to the outbound queue and wake the writer.
+
+        Never touches the socket, so callers are not blocked by slow writes.
+        Priority frames (pings) jump ahead of queued subscription traffic.
+        """
+        if priority:
+            self._outbound.appendleft(frame)
+        else:
+            self._outbound.append(frame)
+        if self._outbound_waker is not None:
+            self._outbound_waker.set()
+
+    async def _writer_loop(self) -> None:
+        """Drain the outbound queue onto the socket.
+
+        Frames go out in bounded batches (``_WRITE_BATCH_FRAMES`` frames or
+        ``_WRITE_BATCH_BYTES`` bytes, whichever comes first); between batches
+        the writer yields so other tasks keep running. Send failures are
+        reported as ``ERROR`` events rather than raised to whoever queued the
+        message.
+        """
+        ws = self._ws
+        waker = self._outbound_waker
+        if ws is None or waker is None:
+            return
+
+        try:
+            while True:
+                await waker.wait()
+                waker.clear()
+                outbound = self._outbound
+                while outbound and not ws.closed:
+                    frames = 0
+                    size = 0
+                    while (
+                        outbound
+                        and frames < _WRITE_BATCH_FRAMES
+                        and size < _WRITE_BATCH_BYTES
+                    ):
+                        frame = outbound.popleft()
+                        frames += 1
+                        size += len(frame)
+                        try:
+                            await ws.send_str(frame)
+                        except Exception as e:
+                            logger.warning("Send failed: %s", e)
+                            self._emit(WsEvent(type=WsEventType.ERROR, error=str(e)))
+                    if outbound:
+                        await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            return
 
     async def _receive_loop(self) -> None:
         """Main receive loop."""
@@ -217,36 +310,35 @@ class WsClient:
 
         try:
             async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                msg_type = msg.type
+                if msg_type in _DATA_FRAMES:
                     try:
                         parsed = parse_message_in(msg.data)
                         # Reset pong tracking on pong
                         if parsed.type == MessageInType.PONG:
-                            self._awaiting_pong = False
-                            self._cancel_task("_pong_timeout_task")
+                            self._last_pong_mono = time.monotonic()
                             self._reconnect_attempts = 0
                         self._emit(WsEvent(type=WsEventType.MESSAGE, message=parsed))
                     except Exception as e:
-                        logger.warning(f"Message parse error: {e}")
-                elif msg.type == aiohttp.WSMsgType.ERROR:
+                        logger.warning("Message parse error: %s", e)
+                elif msg_type == aiohttp.WSMsgType.ERROR:
                     self._emit(WsEvent(
                         type=WsEventType.ERROR,
                         error=str(self._ws.exception()),
                     ))
-                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
+                elif msg_type in _CLOSE_FRAMES:
                     close_code = self._ws.close_code
                     close_reason = str(self._ws.close_code) if self._ws.close_code else ""
                     break
         except asyncio.CancelledError:
             return
         except Exception as e:
-            logger.warning(f"Receive loop error: {e}")
+            logger.warning("Receive loop error: %s", e)
             close_reason = str(e)
 
         # Connection lost
         self._state = ReadyState.CLOSED
-        self._cancel_task("_ping_task")
-        self._cancel_task("_pong_timeout_task")
+        self._cancel_connection_tasks()
 
         self._emit(WsEvent(
             type=WsEventType.DISCONNECTED,
@@ -264,31 +356,35 @@ class WsClient:
             while self._state == ReadyState.OPEN:
                 await asyncio.sleep(self._config.ping_interval_ms / 1000.0)
                 if self._state == ReadyState.OPEN:
-                    await self._send_raw(make_ping())
-                    self._awaiting_pong = True
+                    self._last_ping_mono = time.monotonic()
+                    self._enqueue_frame(_PING_FRAME, priority=True)
                     # Start pong timeout
                     self._cancel_task("_pong_timeout_task")
                     self._pong_timeout_task = asyncio.ensure_future(
-                        self._pong_timeout_check()
+                        self._pong_timeout_check(self._last_ping_mono)
                     )
         except asyncio.CancelledError:
             return
 
-    async def _pong_timeout_check(self) -> None:
-        """Check if pong was received within timeout."""
+    async def _pong_timeout_check(self, ping_sent_at: float) -> None:
+        """Check if pong was received within timeout.
+
+        Timestamps come from ``time.monotonic()`` so wall-clock adjustments
+        (NTP, manual changes) cannot trigger or mask a timeout.
+        """
         try:
             await asyncio.sleep(self._config.pong_timeout_ms / 1000.0)
-            if self._awaiting_pong and self._state == ReadyState.OPEN:
+            if self._last_pong_mono < ping_sent_at and self._state == ReadyState.OPEN:
                 logger.warning(
-                    f"Pong timeout — no response within {self._config.pong_timeout_ms}ms"
+                    "Pong timeout — no response within %dms",
+                    self._config.pong_timeout_ms,
                 )
                 self._emit(WsEvent(
                     type=WsEventType.DISCONNECTED,
                     reason="Pong timeout",
                 ))
                 # Force close and reconnect
-                self._cancel_task("_ping_task")
-                self._cancel_task("_receive_task")
+                self._cancel_connection_tasks()
                 if self._ws and not self._ws.closed:
                     await self._ws.close()
                 self._state = ReadyState.CLOSED
@@ -298,7 +394,7 @@ class WsClient:
             return
 
     async def _try_reconnect(self, rate_limited: bool = False) -> None:
-        """Attempt reconnection with exponential backoff and jitter."""
+        """Attempt reconnection with decorrelated-jitter backoff."""
         while (
             self._should_reconnect
             and self._reconnect_attempts < self._config.max_reconnect_attempts
@@ -306,26 +402,30 @@ class WsClient:
             self._reconnect_attempts += 1
             self._state = ReadyState.CONNECTING
 
-            exp = min(self._reconnect_attempts - 1, 10)
-            base = self._config.base_reconnect_delay_ms * (2 ** exp)
+            base = self._config.base_reconnect_delay_ms
+            cap = 300_000 if rate_limited else 60_000  # 5 minutes / 60 seconds
 
-            if rate_limited:
-                jitter_max = 1000
-                cap = 300_000  # 5 minutes
-            else:
-                jitter_max = 500
-                cap = 60_000  # 60 seconds
-
-            jitter = random.randint(0, jitter_max - 1)
-            delay_ms = min(base + jitter, cap)
+            # Decorrelated jitter: each delay is drawn between the base and 3x
+            # the previous one, so it still grows but clients that dropped
+            # together do not retry in lockstep.
+            delay_ms = int(
+                min(cap, random.uniform(base, self._prev_reconnect_delay_ms * 3))
+            )
+            self._prev_reconnect_delay_ms = delay_ms
             delay = delay_ms / 1000.0
 
             logger.info(
-                f"Reconnect attempt {self._reconnect_attempts}/"
-                f"{self._config.max_reconnect_attempts} in {delay_ms}ms"
-                f"{' (rate-limited)' if rate_limited else ''}"
+                "Reconnect attempt %d/%d in %dms%s",
+                self._reconnect_attempts,
+                self._config.max_reconnect_attempts,
+                delay_ms,
+                " (rate-limited)" if rate_limited else "",
             )
             await asyncio.sleep(delay)
+            # disconnect() may have run during the sleep; connect() would
+            # re-arm _should_reconnect and undo it.
+            if not self._should_reconnect:
+                return
 
             try:
                 await self.connect()
@@ -335,6 +435,29 @@ class WsClient:
 
         self._emit(WsEvent(type=WsEventType.MAX_RECONNECT_REACHED))
 
+    def _cancel_connection_tasks(self) -> list[asyncio.Task]:
+        """Cancel every per-connection task except the caller's own.
+
+        The caller's own attribute stays set: the receive loop and pong
+        timeout go on to run the reconnect backoff in that task, and
+        ``disconnect`` must still be able to cancel it.
+
+        Returns the cancelled tasks so ``disconnect`` can await them and leave
+        no orphans behind; callers running inside one of these tasks must not
+        await the result.
+        """
+        current = asyncio.current_task()
+        cancelled: list[asyncio.Task] = []
+        for attr in _CONNECTION_TASKS:
+            task = getattr(self, attr)
+            if task is None or task is current:
+                continue
+            setattr(self, attr, None)
+            if not task.done():
+                task.cancel()
+                cancelled.append(task)
+        return cancelled
+
     def _cancel_task(self, attr: str) -> None:
         """Cancel and clear a named task attribute."""
         task = getattr(self, attr, None)
@@ -345,7 +468,6 @@ class WsClient:
 
 def _subscribe_params_to_message(params: SubscribeParams) -> dict:
     """Convert SubscribeParams to a wire message dict."""
-    from dataclasses import asdict
     d = asdict(params)
     # Remove include_ohlcv if False (default) for cleaner wire
     return {"method": "subscribe", "params": d}
@@ -353,7 +475,6 @@ def _subscribe_params_to_message(params: SubscribeParams) -> dict:
 
 def _unsubscribe_params_to_message(params: SubscribeParams) -> dict:
     """Convert SubscribeParams to an unsubscribe wire message dict."""
-    from dataclasses import asdict
     d = asdict(params)
     # Remove fields not needed for unsubscribe
     d.pop("include_ohlcv", None)
@@ -1,7 +1,7 @@
 """WebSocket subscription management."""
 
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 
 # ---------------------------------------------------------------------------
@@ -85,28 +85,35 @@ UnsubscribeParams = SubscribeParams  # Same shapes for unsubscribe
 # ---------------------------------------------------------------------------
 
 
+def _sorted_ids(orderbook_ids: list[str]) -> str:
+    return ",".join(sorted(orderbook_ids))
+
+
+# Params type -> key builder; one dict lookup instead of an isinstance chain.
+_KEY_BUILDERS: dict[type, Callable[[Any], str]] = {
+    BookUpdateParams: lambda p: f"book:{_sorted_ids(p.orderbook_ids)}",
+    TradesParams: lambda p: f"trades:{_sorted_ids(p.orderbook_ids)}",
+    UserParams: lambda p: f"user:{p.wallet_address}",
+    PriceHistoryParams: lambda p: f"price_history:{p.orderbook_id}:{p.resolution}",
+    TickerParams: lambda p: f"ticker:{_sorted_ids(p.orderbook_ids)}",
+    MarketParams: lambda p: f"market:{p.market_pubkey}",
+    DepositPriceParams: lambda p: f"deposit_price:{p.deposit_asset}:{p.resolution}",
+    DepositAssetPriceParams: lambda p: f"deposit_asset_price:{p.deposit_asset}",
+}
+
+
 def subscription_key(params: SubscribeParams) -> str:
     """Generate a unique key for a subscription for deduplication."""
-    if isinstance(params, BookUpdateParams):
-        ids = ",".join(sorted(params.orderbook_ids))
-        return f"book:{ids}"
-    elif isinstance(params, TradesParams):
-        ids = ",".join(sorted(params.orderbook_ids))
-        return f"trades:{ids}"
-    elif isinstance(params, UserParams):
-        return f"user:{params.wallet_address}"
-    elif isinstance(params, PriceHistoryParams):
-        return f"price_history:{params.orderbook_id}:{params.resolution}"
-    elif isinstance(params, TickerParams):
-        ids = ",".join(sorted(params.orderbook_ids))
-        return f"ticker:{ids}"
-    elif isinstance(params, MarketParams):
-        return f"market:{params.market_pubkey}"
-    elif isinstance(params, DepositPriceParams):
-        return f"deposit_price:{params.deposit_asset}:{params.resolution}"
-    elif isinstance(params, DepositAssetPriceParams):
-        return f"deposit_asset_price:{params.deposit_asset}"
-    return f"unknown:{id(params)}"
+    builder = _KEY_BUILDERS.get(type(params))
+    if builder is None:
+        # Subclasses of the params types resolve through their bases.
+        for base in type(params).__mro__[1:]:
+            builder = _KEY_BUILDERS.get(base)
+            if builder is not None:
+                break
+        else:
+            return f"unknown:{id(params)}"
+    return builder(params)
 
 
 def unsubscribe_matches(sub: SubscribeParams, unsub: UnsubscribeParams) -> bool:
@@ -31,17 +31,14 @@ def build_exchange_data(
     bump: int,
 ) -> bytes:
     """Build Exchange account data for testing."""
-    data = bytearray()
-    data.extend(EXCHANGE_DISCRIMINATOR)
-    data.extend(bytes(authority))
-    data.extend(bytes(operator))
-    data.extend(bytes(manager))
-    data.extend(struct.pack("<Q", market_count))
-    data.append(1 if paused else 0)
-    data.append(bump)
-    data.extend(struct.pack("<H", 0))
-    data.extend(bytes(4))  # padding
-    return bytes(data)
+    return b"".join((
+        EXCHANGE_DISCRIMINATOR,
+        bytes(authority),
+        bytes(operator),
+        bytes(manager),
+        # market_count, paused, bump, deposit_token_count, padding
+        struct.pack("<Q?BH4x", market_count, paused, bump, 0),
+    ))
 
 
 def build_market_data(
@@ -56,52 +53,40 @@ def build_market_data(
     payout_denominator: int = 0,
 ) -> bytes:
     """Build Market account data for testing."""
-    data = bytearray()
-    data.extend(MARKET_DISCRIMINATOR)
-    data.extend(struct.pack("<Q", market_id))
-    data.append(num_outcomes)
-    data.append(status)
-    data.append(bump)
-    data.extend(bytes(5))  # padding
-    data.extend(bytes(oracle))
-    data.extend(question_id)
-    data.extend(condition_id)
-    for numerator in payout_numerators:
-        data.extend(struct.pack("<I", numerator))
-    data.extend(struct.pack("<I", payout_denominator))
-    return bytes(data)
+    return b"".join((
+        MARKET_DISCRIMINATOR,
+        # market_id, num_outcomes, status, bump, padding
+        struct.pack("<QBBB5x", market_id, num_outcomes, status, bump),
+        bytes(oracle),
+        question_id,
+        condition_id,
+        struct.pack("<6II", *payout_numerators, payout_denominator),
+    ))
 
 
 def build_position_data(owner: Pubkey, market: Pubkey, bump: int) -> bytes:
     """Build Position account data for testing."""
-    data = bytearray()
-    data.extend(POSITION_DISCRIMINATOR)
-    data.extend(bytes(owner))
-    data.extend(bytes(market))
-    data.append(bump)
-    data.extend(bytes(7))  # padding
-    return bytes(data)
+    return b"".join((
+        POSITION_DISCRIMINATOR,
+        bytes(owner),
+        bytes(market),
+        struct.pack("<B7x", bump),  # bump, padding
+    ))
 
 
 def build_order_status_data(
     remaining: int, base_remaining: int, is_cancelled: bool
 ) -> bytes:
     """Build OrderStatus account data for testing."""
-    data = bytearray()
-    data.extend(ORDER_STATUS_DISCRIMINATOR)
-    data.extend(struct.pack("<Q", remaining))
-    data.extend(struct.pack("<Q", base_remaining))
-    data.append(1 if is_cancelled else 0)
-    data.extend(bytes(7))  # padding
-    return bytes(data)
+    # remaining, base_remaining, is_cancelled, padding
+    return ORDER_STATUS_DISCRIMINATOR + struct.pack(
+        "<QQ?7x", remaining, base_remaining, is_cancelled
+    )
 
 
 def build_user_nonce_data(nonce: int) -> bytes:
     """Build UserNonce account data for testing."""
-    data = bytearray()
-    data.extend(USER_NONCE_DISCRIMINATOR)
-    data.extend(struct.pack("<Q", nonce))
-    return bytes(data)
+    return USER_NONCE_DISCRIMINATOR + struct.pack("<Q", nonce)
 
 
 class TestDeserializeExchange:
@@ -140,12 +125,6 @@ class TestDeserializeExchange:
         exchange = deserialize_exchange(data)
         assert exchange.paused is True
 
-    def test_invalid_discriminator(self):
-        data = b"invalid!" + bytes(80)
-
-        with pytest.raises(InvalidDiscriminatorError):
-            deserialize_exchange(data)
-
     def test_data_too_short(self):
         data = EXCHANGE_DISCRIMINATOR + bytes(10)
 
@@ -200,12 +179,6 @@ class TestDeserializeMarket:
         assert market.payout_numerators == (1, 2, 3, 0, 0, 0)
         assert market.payout_denominator == 6
 
-    def test_invalid_discriminator(self):
-        data = b"baddisc!" + bytes(112)
-
-        with pytest.raises(InvalidDiscriminatorError):
-            deserialize_market(data)
-
 
 class TestDeserializePosition:
     def test_deserialize_valid_data(self):
@@ -219,12 +192,6 @@ class TestDeserializePosition:
         assert position.market == market
         assert position.bump == 251
 
-    def test_invalid_discriminator(self):
-        data = b"notposit" + bytes(72)
-
-        with pytest.raises(InvalidDiscriminatorError):
-            deserialize_position(data)
-
 
 class TestDeserializeOrderStatus:
     def test_deserialize_active_order(self):
@@ -245,12 +212,6 @@ class TestDeserializeOrderStatus:
         assert order_status.base_remaining == 250000
         assert order_status.is_cancelled is True
 
-    def test_invalid_discriminator(self):
-        data = b"notorder" + bytes(16)
-
-        with pytest.raises(InvalidDiscriminatorError):
-            deserialize_order_status(data)
-
 
 class TestDeserializeUserNonce:
     def test_deserialize_valid_data(self):
@@ -274,8 +235,19 @@ class TestDeserializeUserNonce:
 
         assert user_nonce.nonce == 2**64 - 1
 
-    def test_invalid_discriminator(self):
-        data = b"badnonce" + bytes(8)
 
-        with pytest.raises(InvalidDiscriminatorError):
-            deserialize_user_nonce(data)
+@pytest.mark.parametrize(
+    ("deserialize", "data"),
+    [
+        (deserialize_exchange, b"invalid!" + bytes(80)),
+        (deserialize_market, b"baddisc!" + bytes(112)),
+        (deserialize_position, b"notposit" + bytes(72)),
+        (deserialize_order_status, b"notorder" + bytes(16)),
+        (deserialize_user_nonce, b"badnonce" + bytes(8)),
+    ],
+    ids=["exchange", "market", "position", "order_status", "user_nonce"],
+)
+def test_invalid_discriminator(deserialize, data):
+    with pytest.raises(InvalidDiscriminatorError) as exc_info:
+        deserialize(data)
+    assert exc_info.value.actual == data[:8]
@@ -0,0 +1,30 @@
+"""Tests for SDK error types."""
+
+import copy
+import pickle
+
+import pytest
+
+from lightcone_sdk.error import ApiRejected, AuthError, HttpError, WsError
+from lightcone_sdk.shared.api_response import ApiRejectedDetails
+
+
+@pytest.mark.parametrize(
+    ("error", "fields"),
+    [
+        (
+            HttpError.rate_limited(retry_after_ms=250),
+            ("kind", "status", "retry_after_ms"),
+        ),
+        (WsError.closed(code=1008, reason="policy"), ("kind", "code")),
+        (AuthError.token_expired(), ("kind",)),
+        (ApiRejected(ApiRejectedDetails(reason="bad", error_code="E1")), ("details",)),
+    ],
+    ids=["http", "ws", "auth", "api_rejected"],
+)
+def test_errors_keep_their_fields_through_pickle_and_copy(error, fields):
+    for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+        assert type(clone) is type(error)
+        assert str(clone) == str(error)
+        for name in fields:
+            assert getattr(clone, name) == getattr(error, name)
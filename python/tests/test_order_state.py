@@ -0,0 +1,94 @@
+"""Tests for user order state containers."""
+
+from lightcone_sdk.domain.order import LimitOrder, OrderStatus, TriggerOrder
+from lightcone_sdk.domain.order.state import UserOpenLimitOrders, UserTriggerOrders
+from lightcone_sdk.shared.types import TimeInForce, TriggerType
+
+
+def make_limit(
+    order_hash: str, market: str = "m1", orderbook: str = "ob1", size: str = "10"
+) -> LimitOrder:
+    return LimitOrder(
+        market_pubkey=market,
+        orderbook_id=orderbook,
+        order_hash=order_hash,
+        side=0,
+        size=size,
+        price="0.5",
+        remaining_size=size,
+    )
+
+
+def make_trigger(
+    trigger_id: str, market: str = "m1", orderbook: str = "ob1"
+) -> TriggerOrder:
+    return TriggerOrder(
+        trigger_order_id=trigger_id,
+        order_hash=f"hash-{trigger_id}",
+        market_pubkey=market,
+        orderbook_id=orderbook,
+        trigger_price="0.4",
+        trigger_type=TriggerType.STOP_LOSS,
+        side=1,
+        amount_in="10",
+        amount_out="4",
+        time_in_force=TimeInForce.GTC,
+    )
+
+
+def test_upsert_replaces_and_remove_finds_order_by_hash():
+    orders = UserOpenLimitOrders()
+    orders.upsert(make_limit("a"))
+    orders.upsert(make_limit("b", market="m2", orderbook="ob2"))
+    orders.upsert(make_limit("a", size="7"))
+
+    assert [o.size for o in orders.get("m1", "ob1")] == ["7"]
+    assert sorted(o.order_hash for o in orders) == ["a", "b"]
+    assert orders.remove("b").order_hash == "b"
+    assert orders.remove("b") is None
+
+    filled = make_limit("a")
+    filled.status = OrderStatus.FILLED
+    orders.update(filled)
+    assert orders.is_empty()
+
+
+def test_orders_passed_to_constructor_are_indexed():
+    orders = UserOpenLimitOrders(orders={"m1": {"ob1": [make_limit("a")]}})
+    assert orders.remove("a").order_hash == "a"
+
+
+def test_trigger_orders_lookup_and_remove_by_id():
+    triggers = UserTriggerOrders()
+    triggers.insert(make_trigger("t1"))
+    triggers.insert(make_trigger("t2", market="m2", orderbook="ob2"))
+
+    assert triggers.get_by_id("t2").market_pubkey == "m2"
+    assert triggers.remove("t1").trigger_order_id == "t1"
+    assert triggers.get_by_id("t1") is None
+    assert len(triggers) == 1
+    assert [t.trigger_order_id for t in triggers] == ["t2"]
+
+    triggers.clear()
+    assert triggers.get_by_id("t2") is None
+    assert triggers.is_empty()
+
+
+def test_lookups_follow_direct_changes_to_orders():
+    orders = UserOpenLimitOrders()
+    orders.upsert(make_limit("a"))
+    orders.orders["m1"]["ob1"] = []
+    orders.orders["m2"] = {"ob2": [make_limit("b", market="m2", orderbook="ob2")]}
+
+    assert orders.remove("a") is None
+    assert orders.remove("b").order_hash == "b"
+    assert orders.is_empty()
+
+    triggers = UserTriggerOrders()
+    triggers.insert(make_trigger("t1"))
+    triggers.orders["m1"]["ob1"].clear()
+    triggers.orders["m2"] = {"ob2": [make_trigger("t2", market="m2", orderbook="ob2")]}
+
+    assert triggers.get_by_id("t1") is None
+    assert triggers.get_by_id("t2").market_pubkey == "m2"
+    assert len(triggers) == 1
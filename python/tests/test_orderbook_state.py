@@ -1,5 +1,9 @@
 """Tests for orderbook sequence handling."""
 
+import copy
+import dataclasses
+import pickle
+
 from lightcone_sdk.domain.orderbook.state import OrderbookState
 from lightcone_sdk.domain.orderbook.wire import WsBookLevel, WsOrderBook
 
@@ -207,3 +211,145 @@ def test_resync_requires_refresh_and_preserves_existing_book():
     assert result.kind == "ignored"
     assert result.reason is not None
     assert result.reason.kind == "already_awaiting_snapshot"
+
+
+def test_zero_size_spellings_remove_levels():
+    book = OrderbookState(orderbook_id="ob1")
+    book.apply(
+        make_book(
+            is_snapshot=True,
+            seq=0,
+            bids=[("0.45", "10"), ("0.44", "0.5"), ("0.43", "3")],
+            asks=[("0.55", "12"), ("0.56", "100")],
+        )
+    )
+
+    book.apply(
+        make_book(
+            is_snapshot=False,
+            seq=1,
+            bids=[("0.45", "0.000"), ("0.43", "0E-9")],
+            asks=[("0.55", ".0")],
+        )
+    )
+
+    assert book.bids == {"0.44": "0.5"}
+    assert book.asks == {"0.56": "100"}
+
+
+def test_top_levels_are_sorted_by_price():
+    book = OrderbookState(orderbook_id="ob1")
+    book.apply(
+        make_book(
+            is_snapshot=True,
+            seq=0,
+            bids=[("0.9", "1"), ("0.45", "2"), ("0.5", "3")],
+            asks=[("0.55", "4"), ("0.6", "5"), ("1.2", "6")],
+        )
+    )
+    book.apply(
+        make_book(
+            is_snapshot=False,
+            seq=1,
+            bids=[("0.9", "0"), ("0.48", "7")],
+            asks=[("0.52", "8")],
+        )
+    )
+
+    assert book.best_bid() == "0.5"
+    assert book.best_ask() == "0.52"
+    assert book.top_bids(2) == [("0.5", "3"), ("0.48", "7")]
+    assert book.top_asks(10) == [
+        ("0.52", "8"),
+        ("0.55", "4"),
+        ("0.6", "5"),
+        ("1.2", "6"),
+    ]
+    assert book.top_bids(0) == []
+    assert book.total_bid_depth() == 12.0
+    assert book.total_ask_depth() == 23.0
+
+
+def test_mid_and_spread_follow_book_updates():
+    book = OrderbookState(orderbook_id="ob1")
+    book.apply(
+        make_book(is_snapshot=True, seq=0, bids=[("0.4", "1")], asks=[("0.6", "1")])
+    )
+    assert book.mid_price() == "0.5"
+    assert book.spread() == "0.2"
+
+    book.apply(make_book(is_snapshot=False, seq=1, bids=[("0.5", "1")]))
+    assert book.mid_price() == "0.55"
+    assert book.spread() == "0.1"
+
+    book.clear()
+    assert book.mid_price() is None
+    assert book.spread() is None
+
+
+def test_direct_writes_to_book_sides_stay_indexed():
+    book = OrderbookState(orderbook_id="ob1", bids={"0.4": "1"})
+    book.apply(
+        make_book(is_snapshot=True, seq=0, bids=[("0.4", "1")], asks=[("0.6", "2")])
+    )
+    assert book.mid_price() == "0.5"
+
+    book.bids["0.45"] = "3"
+    book.asks.update({"0.55": "1"})
+    assert book.best_bid() == "0.45"
+    assert book.best_ask() == "0.55"
+    assert book.mid_price() == "0.50"
+    assert book.total_bid_depth() == 4.0
+
+    del book.bids["0.45"]
+    book.asks.pop("0.55")
+    assert book.top_bids(5) == [("0.4", "1")]
+    assert book.best_ask() == "0.6"
+
+    book.bids = {"0.3": "1", "0.35": "2"}
+    assert book.best_bid() == "0.35"
+    book.apply(make_book(is_snapshot=False, seq=1, bids=[("0.35", "0")]))
+    assert book.bids == {"0.3": "1"}
+
+
+def test_book_state_copies_and_pickles():
+    book = OrderbookState(orderbook_id="ob1")
+    book.apply(
+        make_book(is_snapshot=True, seq=0, bids=[("0.4", "1")], asks=[("0.6", "2")])
+    )
+
+    clones = (copy.copy(book), copy.deepcopy(book), pickle.loads(pickle.dumps(book)))
+    for clone in clones:
+        assert clone == book
+        assert clone.best_bid() == "0.4"
+        assert clone.best_ask() == "0.6"
+
+    clone = copy.deepcopy(book)
+    clone.bids["0.5"] = "1"
+    assert clone.best_bid() == "0.5"
+    assert book.best_bid() == "0.4"
+
+    as_dict = dataclasses.asdict(book)
+    assert as_dict["bids"] == {"0.4": "1"}
+    assert as_dict["asks"] == {"0.6": "2"}
+
+
+def test_malformed_levels_are_kept_but_not_ranked():
+    book = OrderbookState(orderbook_id="ob1")
+    book.apply(
+        make_book(
+            is_snapshot=True,
+            seq=0,
+            bids=[("0.4", "1"), ("bad", "2"), ("0.3", "n/a")],
+        )
+    )
+    book.apply(make_book(is_snapshot=False, seq=1, bids=[("0.5", "oops")]))
+
+    assert book.bids == {"0.4": "1", "bad": "2", "0.3": "n/a", "0.5": "oops"}
+    assert book.best_bid() == "0.5"
+    assert book.top_bids(10) == [("0.5", "oops"), ("0.4", "1"), ("0.3", "n/a")]
+    assert book.total_bid_depth() == 3.0
+
+    book.apply(make_book(is_snapshot=False, seq=2, bids=[("bad", "0"), ("0.5", "0")]))
+    assert book.bids == {"0.4": "1", "0.3": "n/a"}
+    assert book.best_bid() == "0.4"
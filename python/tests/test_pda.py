@@ -69,6 +69,9 @@ class TestGetMarketPda:
         assert pda1 == pda2
         assert bump1 == bump2
 
+    def test_repeated_derivation_is_memoized(self):
+        assert get_market_pda(43) is get_market_pda(43)
+
 
 class TestGetVaultPda:
     def test_derives_valid_pda(self):
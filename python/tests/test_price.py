@@ -0,0 +1,15 @@
+"""Tests for shared price helpers."""
+
+import pytest
+
+from lightcone_sdk.shared.price import is_zero
+
+
+@pytest.mark.parametrize("value", ["0", "0.000000", "000", ".0", "0.", "0E-9", "-0", " 0 "])
+def test_is_zero_true(value):
+    assert is_zero(value)
+
+
+@pytest.mark.parametrize("value", ["1", "0.5", "10", "0.000001", "1E-9", "", ".", "abc"])
+def test_is_zero_false(value):
+    assert not is_zero(value)
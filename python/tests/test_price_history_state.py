@@ -0,0 +1,73 @@
+"""Tests for price history state ordering."""
+
+from lightcone_sdk.domain.price_history import LineData, PriceHistoryKey
+from lightcone_sdk.domain.price_history.state import (
+    DepositPriceState,
+    PriceHistoryState,
+)
+from lightcone_sdk.domain.price_history.wire import DepositTokenCandle
+
+
+def test_updates_keep_series_ordered_by_time():
+    state = PriceHistoryState()
+    state.apply_snapshot("ob1", "1m", [LineData(60, "0.1"), LineData(180, "0.3")])
+
+    state.apply_update("ob1", "1m", LineData(240, "0.4"))
+    state.apply_update("ob1", "1m", LineData(240, "0.41"))
+    state.apply_update("ob1", "1m", LineData(120, "0.2"))
+    state.apply_update("ob1", "1m", LineData(60, "0.11"))
+
+    assert [(p.time, p.value) for p in state.get("ob1", "1m")] == [
+        (60, "0.11"),
+        (120, "0.2"),
+        (180, "0.3"),
+        (240, "0.41"),
+    ]
+    assert state.get_point("ob1", "1m", 120).value == "0.2"
+    assert state.get_point("ob1", "1m", 150) is None
+    assert state.get_point("ob2", "1m", 120) is None
+
+
+def test_late_deposit_candle_is_inserted_in_order():
+    state = DepositPriceState()
+    state.apply_snapshot(
+        "SOL", "1m", [DepositTokenCandle(t=60, c="1"), DepositTokenCandle(t=180, c="3")]
+    )
+
+    state.apply_candle_update("SOL", "1m", DepositTokenCandle(t=120, c="2"))
+    state.apply_candle_update("SOL", "1m", DepositTokenCandle(t=60, tc=5, c="1.5"))
+
+    assert [(c.t, c.c) for c in state.get_candles("SOL", "1m")] == [
+        (60, "1.5"),
+        (120, "2"),
+        (180, "3"),
+    ]
+
+
+def test_series_are_unbounded_by_default():
+    state = PriceHistoryState()
+    state.apply_snapshot("ob1", "1m", [LineData(t, str(t)) for t in range(2000)])
+    state.apply_update("ob1", "1m", LineData(2000, "2000"))
+    assert len(state.get("ob1", "1m")) == 2001
+
+
+def test_max_points_trims_updates_but_not_snapshots():
+    state = PriceHistoryState(max_points=4)
+    state.apply_snapshot("ob1", "1m", [LineData(t, str(t)) for t in range(6)])
+    assert len(state.get("ob1", "1m")) == 6
+
+    # Trimming waits for a quarter (at least one point) of slack over the cap.
+    state = PriceHistoryState(max_points=4)
+    state.apply_snapshot("ob1", "1m", [LineData(t, str(t)) for t in range(4)])
+    state.apply_update("ob1", "1m", LineData(4, "4"))
+    assert [p.time for p in state.get("ob1", "1m")] == [0, 1, 2, 3, 4]
+    state.apply_update("ob1", "1m", LineData(5, "5"))
+    assert [p.time for p in state.get("ob1", "1m")] == [2, 3, 4, 5]
+
+
+def test_price_history_key_matches_state_key():
+    state = PriceHistoryState()
+    key = PriceHistoryKey(orderbook_id="ob1", resolution="1m")
+
+    assert key == state.key("ob1", "1m")
+    assert hash(key) == hash(("ob1", "1m"))
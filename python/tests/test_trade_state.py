@@ -24,6 +24,7 @@ def test_trade_history_reorders_by_sequence():
     history.push(make_trade("t2", 2))
 
     assert [trade.trade_id for trade in history.trades()] == ["t1", "t2", "t3"]
+    assert [trade.trade_id for trade in history] == ["t1", "t2", "t3"]
 
 
 def test_trade_history_drops_older_sequence_when_full():
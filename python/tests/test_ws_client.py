@@ -0,0 +1,67 @@
+"""Tests for WsClient event dispatch and reconnection."""
+
+import asyncio
+
+from lightcone_sdk.ws import ReadyState, WsConfig, WsEvent, WsEventType
+from lightcone_sdk.ws.client import WsClient
+
+
+def test_callback_unsubscribing_during_dispatch_does_not_skip_others():
+    client = WsClient()
+    seen: list[str] = []
+
+    def first(event):
+        seen.append("first")
+        unsubscribe_first()
+
+    def second(event):
+        seen.append("second")
+
+    unsubscribe_first = client.on(first)
+    client.on(second)
+
+    client._emit(WsEvent(type=WsEventType.CONNECTED))
+    client._emit(WsEvent(type=WsEventType.CONNECTED))
+
+    assert seen == ["first", "second", "second"]
+
+
+class _ClosedSocket:
+    """A socket whose message stream ends immediately, as on a dropped link."""
+
+    closed = True
+    close_code = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+def test_disconnect_during_reconnect_backoff_stops_reconnecting():
+    client = WsClient(WsConfig(base_reconnect_delay_ms=50))
+    connects: list[int] = []
+
+    async def fake_connect():
+        connects.append(1)
+
+    client.connect = fake_connect
+
+    async def scenario():
+        client._ws = _ClosedSocket()
+        client._should_reconnect = True
+        client._state = ReadyState.OPEN
+        client._receive_task = asyncio.ensure_future(client._receive_loop())
+        # Let the receive loop see the drop and enter the backoff sleep.
+        await asyncio.sleep(0.01)
+        assert client._receive_task is not None
+        assert not client._receive_task.done()
+
+        await client.disconnect()
+        await asyncio.sleep(0.2)
+
+    asyncio.run(scenario())
+
+    assert connects == []
+    assert client.ready_state() == ReadyState.CLOSED
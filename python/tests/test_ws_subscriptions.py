@@ -0,0 +1,21 @@
+"""Tests for WebSocket subscription helpers."""
+
+from lightcone_sdk.ws.subscriptions import (
+    BookUpdateParams,
+    DepositPriceParams,
+    PriceHistoryParams,
+    TradesParams,
+    UserParams,
+    subscription_key,
+)
+
+
+def test_subscription_key_is_deterministic():
+    assert subscription_key(BookUpdateParams(orderbook_ids=["b", "a"])) == "book:a,b"
+    assert subscription_key(TradesParams(orderbook_ids=["a"])) == "trades:a"
+    assert subscription_key(UserParams(wallet_address="w")) == "user:w"
+    assert (
+        subscription_key(PriceHistoryParams(orderbook_id="ob", resolution="5m"))
+        == "price_history:ob:5m"
+    )
+    assert subscription_key(DepositPriceParams(deposit_asset="SOL")) == "deposit_price:SOL:1m"